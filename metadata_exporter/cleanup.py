@@ -17,10 +17,13 @@ from __future__ import annotations
 import argparse
 import json
 import logging
-from dataclasses import dataclass
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from textwrap import shorten
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Sequence
 
 from . import db
 
@@ -59,7 +62,47 @@ _NORMALISATION_MAP: dict[str, str] = {
     "\u00bf": "'",
 }
 
-_TRANSLATION_TABLE = str.maketrans(_NORMALISATION_MAP)
+# str.translate and Oracle's TRANSLATE both rely on one-to-one glyph mappings;
+# multi-character rules would need a different normaliser.
+if any(
+    len(glyph) != 1 or len(replacement) != 1
+    for glyph, replacement in _NORMALISATION_MAP.items()
+):
+    raise ValueError("Normalisation map entries must map single characters.")
+
+# Keyed by code point, the form str.translate consumes directly.
+_TRANSLATION_TABLE: dict[int, str] = {
+    ord(glyph): replacement for glyph, replacement in _NORMALISATION_MAP.items()
+}
+
+# The only ASCII glyph in the map; every other target lies outside ASCII.
+_ASCII_TARGET = "\u0060"
+
+# Oracle regular expression matching any glyph in the normalisation map, used to
+# restrict scans to candidate rows on the database side.
+_CANDIDATE_PATTERN = "[" + "".join(_NORMALISATION_MAP) + "]"
+
+# Compiled equivalent used to skip translation for values with nothing to change.
+_CANDIDATE_RE = re.compile(_CANDIDATE_PATTERN)
+
+# Positional from/to strings for Oracle's TRANSLATE, mirroring the map 1:1.
+_TRANSLATE_SOURCE = "".join(_NORMALISATION_MAP)
+_TRANSLATE_TARGET = "".join(_NORMALISATION_MAP.values())
+
+# Number of rows bound into a single executemany() call; bounds UNDO per batch.
+_UPDATE_BATCH_SIZE = 1000
+
+# Rows fetched per network round-trip while scanning a target column.
+_FETCH_ARRAY_SIZE = 1000
+
+# Statements kept in the session cache; comfortably above the per-run target count.
+_STATEMENT_CACHE_SIZE = 40
+
+# Degree of parallelism requested for server-side updates in --fast mode.
+_PARALLEL_DEGREE = 4
+
+# Database character sets able to hold every glyph in the normalisation map.
+_UNICODE_CHARACTER_SETS = frozenset({"AL32UTF8", "UTF8", "UTFE"})
 
 
 @dataclass(slots=True)
@@ -71,12 +114,29 @@ class CleanupTarget:
         column: Column name that requires normalisation.
         where: Optional SQL WHERE clause predicate to narrow the scan.
         identifier: Optional column name to include in log output for traceability.
+        select_sql: Candidate-row scan statement, built once from the fields above.
+        update_sql: Per-row UPDATE statement binding `value` and `rowid`.
     """
 
     table: str
     column: str
     where: str | None = None
     identifier: str | None = None
+    select_sql: str = field(init=False, repr=False, compare=False)
+    update_sql: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Assemble the target's SQL statements once at construction."""
+        select_columns = ["ROWID", self.column]
+        if self.identifier:
+            select_columns.append(self.identifier)
+        self.select_sql = (
+            f"SELECT {', '.join(select_columns)} FROM {self.table} "
+            f"{_candidate_filter(self)}"
+        )
+        self.update_sql = (
+            f"UPDATE {self.table} SET {self.column} = :value WHERE ROWID = :rowid"
+        )
 
     @classmethod
     def from_payload(cls, payload: dict[str, str]) -> "CleanupTarget":
@@ -138,7 +198,15 @@ def normalise_quotes(value: str) -> str:
 
     Returns:
         String with all problematic quotation marks replaced by ASCII equivalents.
+        The original object is returned unchanged when no replacement applies.
     """
+    if value.isascii():
+        if _ASCII_TARGET not in value:
+            return value
+    elif _CANDIDATE_RE.search(value) is None:
+        return value
+    # Only values containing a target glyph reach this point; str.translate runs
+    # in C, so a compiled extension would add a build step for little gain.
     return value.translate(_TRANSLATION_TABLE)
 
 
@@ -173,10 +241,68 @@ def _summarise(text: str, width: int = 120) -> str:
     return shorten(text, width=width, placeholder="…")
 
 
+def _candidate_filter(target: CleanupTarget) -> str:
+    """Build the WHERE clause restricting a target to rows needing normalisation.
+
+    Parameters:
+        target: CleanupTarget describing the table and column to scan.
+
+    Returns:
+        SQL WHERE clause binding `:pattern`, combined with any configured predicate.
+    """
+    clause = f"WHERE REGEXP_LIKE({target.column}, :pattern)"
+    if target.where:
+        clause += f" AND ({target.where})"
+    return clause
+
+
+def _format_change(
+    target: CleanupTarget,
+    rowid: str,
+    identifier: str | None,
+    original: str,
+    converted: str,
+) -> str:
+    """Describe a single proposed change for a target column.
+
+    Parameters:
+        target: CleanupTarget the change belongs to.
+        rowid: ROWID of the affected row, used when no identifier is available.
+        identifier: Optional identifier value used to trace the affected row.
+        original: Value currently stored in the database.
+        converted: Normalised replacement value.
+
+    Returns:
+        Log line showing the truncated before and after values.
+    """
+    label = identifier if identifier is not None else f"ROWID={rowid}"
+    return (
+        f"{target.table}.{target.column} ({label}): "
+        f"{_summarise(original)} -> {_summarise(converted)}"
+    )
+
+
+def _log_changes(lines: list[str]) -> None:
+    """Emit accumulated change descriptions as a single log record.
+
+    Parameters:
+        lines: Change descriptions produced by `_format_change`.
+
+    Returns:
+        None. The list is cleared once written.
+    """
+    if lines:
+        LOGGER.info("\n".join(lines))
+        lines.clear()
+
+
 def _select_rows(
     cursor: "db.Cursor", target: CleanupTarget
 ) -> Iterable[tuple[str, str | None, str | None]]:
-    """Select rows from a target table for processing.
+    """Select candidate rows from a target table for processing.
+
+    Only rows whose column contains at least one glyph from the normalisation
+    map are returned, so unaffected rows never leave the database.
 
     Parameters:
         cursor: Database cursor for executing queries.
@@ -185,14 +311,7 @@ def _select_rows(
     Yields:
         Tuples of (rowid, column_value, identifier) for each matching row.
     """
-    select_columns = ["ROWID", target.column]
-    if target.identifier:
-        select_columns.append(target.identifier)
-    select_clause = ", ".join(select_columns)
-    sql = f"SELECT {select_clause} FROM {target.table}"
-    if target.where:
-        sql += f" WHERE {target.where}"
-    cursor.execute(sql)
+    cursor.execute(target.select_sql, pattern=_CANDIDATE_PATTERN)
     for row in cursor:
         rowid = row[0]
         value = row[1]
@@ -200,18 +319,50 @@ def _select_rows(
         yield rowid, value, identifier
 
 
+def _flush_updates(cursor: "db.Cursor", params: list[dict[str, str]]) -> int:
+    """Send a batch of pending updates to the database in one round-trip.
+
+    The batch is executed as array DML with per-row error collection, so every
+    failing row in the batch is reported rather than only the first.
+
+    Parameters:
+        cursor: Cursor already prepared with the UPDATE statement for the target.
+        params: Bind dictionaries for each row in the batch.
+
+    Returns:
+        Number of rows actually updated by the batch.
+
+    Raises:
+        RuntimeError: When one or more rows in the batch could not be updated.
+    """
+    cursor.executemany(None, params, batcherrors=True, arraydmlrowcounts=True)
+    errors = cursor.getbatcherrors()
+    if errors:
+        for error in errors:
+            LOGGER.error(
+                "Update failed for ROWID=%s: %s",
+                params[error.offset]["rowid"],
+                error.message,
+            )
+        raise RuntimeError(f"{len(errors)} update(s) failed within a batch.")
+    return sum(cursor.getarraydmlrowcounts())
+
+
 def _apply_updates(
-    connection: "db.Connection",
+    select_cursor: "db.Cursor",
+    update_cursor: "db.Cursor",
     target: CleanupTarget,
     dry_run: bool,
 ) -> int:
     """Process a cleanup target and apply normalisation updates.
 
-    Scans the specified table column, identifies rows requiring normalisation,
-    logs all proposed changes, and optionally applies updates to the database.
+    Streams the specified table column, identifies rows requiring normalisation,
+    logs all proposed changes, and optionally applies updates to the database in
+    batches as the scan progresses.
 
     Parameters:
-        connection: Active database connection.
+        select_cursor: Cursor used to scan the target column.
+        update_cursor: Cursor used to apply UPDATE batches.
         target: CleanupTarget describing the table and column to process.
         dry_run: When True, log changes without applying updates.
 
@@ -219,52 +370,178 @@ def _apply_updates(
         Number of rows updated (zero in dry-run mode).
     """
     total_updates = 0
-    with connection.cursor() as cursor:
-        rows = list(_select_rows(cursor, target))
-
-    updates: list[tuple[str, str, str | None, str]] = []
-    for rowid, current_value, identifier in rows:
+    pending_changes = 0
+    batch: list[dict[str, str]] = []
+    log_enabled = LOGGER.isEnabledFor(logging.INFO)
+    change_lines: list[str] = []
+
+    if not dry_run:
+        update_cursor.prepare(target.update_sql)
+    for rowid, current_value, identifier in _select_rows(select_cursor, target):
         if current_value is None:
             continue
-        converted = normalise_quotes(str(current_value))
-        if converted != str(current_value):
-            updates.append((rowid, converted, identifier, str(current_value)))
+        # LOB values are read on every str() call, so coerce only once.
+        original = (
+            current_value if isinstance(current_value, str) else str(current_value)
+        )
+        converted = normalise_quotes(original)
+        if converted is original or converted == original:
+            continue
+
+        pending_changes += 1
+        if log_enabled:
+            change_lines.append(
+                _format_change(target, rowid, identifier, original, converted)
+            )
+            if len(change_lines) >= _UPDATE_BATCH_SIZE:
+                _log_changes(change_lines)
+        if dry_run:
+            continue
 
-    if not updates:
+        batch.append({"value": converted, "rowid": rowid})
+        if len(batch) >= _UPDATE_BATCH_SIZE:
+            total_updates += _flush_updates(update_cursor, batch)
+            batch = []
+
+    if batch:
+        total_updates += _flush_updates(update_cursor, batch)
+    _log_changes(change_lines)
+
+    if not pending_changes:
         LOGGER.info("No changes required for %s.%s", target.table, target.column)
         return 0
 
-    for rowid, converted, identifier, original in updates:
-        label = identifier if identifier is not None else f"ROWID={rowid}"
-        LOGGER.info(
-            "%s.%s (%s): %s -> %s",
-            target.table,
-            target.column,
-            label,
-            _summarise(original),
-            _summarise(converted),
-        )
-
     if dry_run:
         LOGGER.info(
             "Dry-run active: %s pending update(s) recorded for %s.%s",
-            len(updates),
+            pending_changes,
             target.table,
             target.column,
         )
         return 0
 
-    with connection.cursor() as cursor:
-        sql = f"UPDATE {target.table} SET {target.column} = :value WHERE ROWID = :rowid"
-        for rowid, converted, _, _ in updates:
-            cursor.execute(sql, value=converted, rowid=rowid)
-            total_updates += 1
     LOGGER.info(
         "Applied %s update(s) for %s.%s", total_updates, target.table, target.column
     )
     return total_updates
 
 
+def _apply_server_side(
+    select_cursor: "db.Cursor",
+    update_cursor: "db.Cursor",
+    target: CleanupTarget,
+    dry_run: bool,
+    parallel: bool = False,
+) -> int:
+    """Normalise a cleanup target inside Oracle using TRANSLATE.
+
+    In dry-run mode the translated values are selected and logged without
+    modifying the table. Otherwise a single UPDATE rewrites every candidate row
+    on the database side, so column values never travel to the client.
+
+    Oracle converts the bound glyph strings to the column's character set, so
+    callers must first confirm the database uses Unicode; see
+    `_require_unicode_database`.
+
+    Parameters:
+        select_cursor: Cursor used to preview translated values in dry-run mode.
+        update_cursor: Cursor used to apply the UPDATE statement.
+        target: CleanupTarget describing the table and column to process.
+        dry_run: When True, log changes without applying updates.
+        parallel: When True, hint Oracle to run the UPDATE with parallel slaves.
+
+    Returns:
+        Number of rows updated (zero in dry-run mode).
+    """
+    binds = {
+        "source": _TRANSLATE_SOURCE,
+        "target": _TRANSLATE_TARGET,
+        "pattern": _CANDIDATE_PATTERN,
+    }
+    translated = f"TRANSLATE({target.column}, :source, :target)"
+    candidate_filter = _candidate_filter(target)
+
+    if not dry_run:
+        # A statement-level hint needs no table alias, so predicates qualified
+        # with the table name behave exactly as in the dry-run SELECT.
+        hint = f"/*+ PARALLEL({_PARALLEL_DEGREE}) */ " if parallel else ""
+        update_cursor.execute(
+            f"UPDATE {hint}{target.table} SET {target.column} = {translated} "
+            f"{candidate_filter}",
+            binds,
+        )
+        total_updates = update_cursor.rowcount
+        if not total_updates:
+            LOGGER.info("No changes required for %s.%s", target.table, target.column)
+            return 0
+        LOGGER.info(
+            "Applied %s update(s) for %s.%s", total_updates, target.table, target.column
+        )
+        return total_updates
+
+    select_columns = ["ROWID", target.column, translated]
+    if target.identifier:
+        select_columns.append(target.identifier)
+    select_cursor.execute(
+        f"SELECT {', '.join(select_columns)} FROM {target.table} {candidate_filter}",
+        binds,
+    )
+    pending_changes = 0
+    log_enabled = LOGGER.isEnabledFor(logging.INFO)
+    change_lines: list[str] = []
+    for row in select_cursor:
+        if row[1] is None:
+            continue
+        original = str(row[1])
+        converted = str(row[2])
+        if converted == original:
+            continue
+        pending_changes += 1
+        if log_enabled:
+            identifier = row[3] if target.identifier else None
+            change_lines.append(
+                _format_change(target, row[0], identifier, original, converted)
+            )
+            if len(change_lines) >= _UPDATE_BATCH_SIZE:
+                _log_changes(change_lines)
+    _log_changes(change_lines)
+
+    if not pending_changes:
+        LOGGER.info("No changes required for %s.%s", target.table, target.column)
+        return 0
+    LOGGER.info(
+        "Dry-run active: %s pending update(s) recorded for %s.%s",
+        pending_changes,
+        target.table,
+        target.column,
+    )
+    return 0
+
+
+def _require_unicode_database(connection: "db.Connection") -> None:
+    """Refuse server-side normalisation unless the database uses Unicode.
+
+    In any other character set, glyphs it cannot hold arrive in the TRANSLATE
+    and REGEXP_LIKE arguments as replacement characters such as '?', and the
+    UPDATE would then rewrite genuine question marks in the data.
+
+    Parameters:
+        connection: Active database connection.
+
+    Returns:
+        None. The check passes silently for Unicode databases.
+
+    Raises:
+        RuntimeError: When NLS_CHARACTERSET is not a Unicode character set.
+    """
+    character_set = db.fetch_database_character_set(connection)
+    if character_set not in _UNICODE_CHARACTER_SETS:
+        raise RuntimeError(
+            f"--server-side requires a Unicode database character set; found "
+            f"{character_set}. Run without --server-side to normalise in Python."
+        )
+
+
 def parse_arguments(args: Sequence[str] | None = None) -> argparse.Namespace:
     """Parse command-line arguments for the cleanup utility.
 
@@ -295,12 +572,40 @@ def parse_arguments(args: Sequence[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Apply updates instead of running in dry-run mode.",
     )
+    parser.add_argument(
+        "--server-side",
+        action="store_true",
+        help=(
+            "Normalise values inside Oracle with TRANSLATE instead of fetching "
+            "them; committed runs log totals rather than individual rows."
+        ),
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help=(
+            "With --server-side, enable Oracle parallel DML for the updates. "
+            "Each target is then committed separately."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of targets processed concurrently from a session pool. "
+            "With more than one worker each target is committed separately."
+        ),
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
         help="Enable verbose logging for diagnostic purposes.",
     )
-    return parser.parse_args(args)
+    parsed = parser.parse_args(args)
+    if parsed.fast and not parsed.server_side:
+        parser.error("--fast requires --server-side")
+    return parsed
 
 
 def load_environment(env_file: Path | None) -> None:
@@ -331,11 +636,100 @@ def load_environment(env_file: Path | None) -> None:
     LOGGER.debug("Environment variables loaded from %s", env_file)
 
 
+def _run_targets(
+    connection: "db.Connection",
+    targets: Sequence[CleanupTarget],
+    apply_target: Callable[..., int],
+    dry_run: bool,
+    parallel_dml: bool = False,
+) -> int:
+    """Process targets on a single connection, then commit or roll back.
+
+    Parameters:
+        connection: Active database connection owning the transaction.
+        targets: CleanupTargets to process in order.
+        apply_target: Strategy applied to each target (client or server side).
+        dry_run: When True, roll back instead of committing.
+        parallel_dml: When True, try to enable parallel DML for the session.
+
+    Returns:
+        Number of rows updated across the supplied targets.
+    """
+    total_updates = 0
+    connection.autocommit = False  # type: ignore[attr-defined]
+    connection.stmtcachesize = _STATEMENT_CACHE_SIZE
+    if parallel_dml and not db.enable_parallel_dml(connection):
+        LOGGER.debug("Parallel DML not permitted; updates will run serially.")
+    with connection.cursor() as select_cursor, connection.cursor() as update_cursor:
+        select_cursor.arraysize = _FETCH_ARRAY_SIZE
+        select_cursor.prefetchrows = _FETCH_ARRAY_SIZE
+        update_cursor.arraysize = _UPDATE_BATCH_SIZE
+        for target in targets:
+            total_updates += apply_target(
+                select_cursor, update_cursor, target, dry_run=dry_run
+            )
+    if dry_run:
+        connection.rollback()
+    else:
+        connection.commit()
+    return total_updates
+
+
+def _group_by_table(targets: Sequence[CleanupTarget]) -> list[list[CleanupTarget]]:
+    """Group targets by table, keeping configuration order within each group.
+
+    Parameters:
+        targets: CleanupTargets loaded from the configuration.
+
+    Returns:
+        One list of targets per distinct table, in order of first appearance.
+    """
+    groups: dict[str, list[CleanupTarget]] = {}
+    for target in targets:
+        groups.setdefault(target.table.upper(), []).append(target)
+    return list(groups.values())
+
+
+def _run_pooled_targets(
+    pool: "db.ConnectionPool",
+    targets: Sequence[CleanupTarget],
+    apply_target: Callable[..., int],
+    dry_run: bool,
+    parallel_dml: bool = False,
+) -> int:
+    """Process one table's targets on a pooled connection, one transaction each.
+
+    Targets on the same table share a worker so that their transactions never
+    update the same rows concurrently, which would block on row locks and
+    could deadlock (ORA-00060).
+
+    Parameters:
+        pool: Session pool supplying the connection.
+        targets: CleanupTargets for a single table, processed in order.
+        apply_target: Strategy applied to each target (client or server side).
+        dry_run: When True, roll back instead of committing.
+        parallel_dml: When True, try to enable parallel DML for the session.
+
+    Returns:
+        Number of rows updated across the supplied targets.
+    """
+    total_updates = 0
+    with pool.acquire() as connection:
+        for target in targets:
+            total_updates += _run_targets(
+                connection, [target], apply_target, dry_run, parallel_dml=parallel_dml
+            )
+    return total_updates
+
+
 def run_cleanup(args: argparse.Namespace) -> int:
     """Execute the cleanup process for all configured targets.
 
     Loads configuration, connects to the database, processes each target,
-    and either commits or rolls back changes based on dry-run mode.
+    and either commits or rolls back changes based on dry-run mode. With more
+    than one worker, tables are processed concurrently on pooled connections;
+    the targets of one table run in turn on the same connection, and each
+    target is committed independently.
 
     Parameters:
         args: Parsed command-line arguments.
@@ -345,6 +739,7 @@ def run_cleanup(args: argparse.Namespace) -> int:
 
     Raises:
         FileNotFoundError: When the configuration file is missing.
+        RuntimeError: When --server-side is used on a non-Unicode database.
     """
     config_path = Path(args.config)
     if not config_path.exists():
@@ -353,18 +748,52 @@ def run_cleanup(args: argparse.Namespace) -> int:
     load_environment(Path(args.env_file) if args.env_file else None)
 
     dry_run = not args.commit
+    parallel_dml = args.fast and not dry_run
+    apply_target: Callable[..., int] = _apply_updates
+    if args.server_side:
+        apply_target = partial(_apply_server_side, parallel=parallel_dml)
+    table_groups = _group_by_table(targets)
+    workers = max(1, min(args.workers, len(table_groups)))
     total_updates = 0
 
-    with db.create_connection() as connection:
-        connection.autocommit = False  # type: ignore[attr-defined]
-        for target in targets:
-            total_updates += _apply_updates(connection, target, dry_run=dry_run)
-        if dry_run:
-            connection.rollback()
-            LOGGER.info("Rollback complete (dry-run).")
-        else:
-            connection.commit()
-            LOGGER.info("Committed %s update(s) in total.", total_updates)
+    if workers == 1:
+        # A table modified by parallel DML cannot be read again in the same
+        # transaction (ORA-12838), so fast runs commit after every target.
+        batches = [[target] for target in targets] if parallel_dml else [targets]
+        with db.create_connection() as connection:
+            if args.server_side:
+                _require_unicode_database(connection)
+            for batch in batches:
+                total_updates += _run_targets(
+                    connection, batch, apply_target, dry_run, parallel_dml=parallel_dml
+                )
+    else:
+        pool = db.create_pool(max_size=workers)
+        try:
+            if args.server_side:
+                with pool.acquire() as connection:
+                    _require_unicode_database(connection)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _run_pooled_targets,
+                        pool,
+                        group,
+                        apply_target,
+                        dry_run,
+                        parallel_dml,
+                    )
+                    for group in table_groups
+                ]
+                for future in as_completed(futures):
+                    total_updates += future.result()
+        finally:
+            pool.close()
+
+    if dry_run:
+        LOGGER.info("Rollback complete (dry-run).")
+    else:
+        LOGGER.info("Committed %s update(s) in total.", total_updates)
     return total_updates
 
 
@@ -1,5 +1,3 @@
-from __future__ import annotations
-
 """
 Project: LandIS Portal
 Institution: Cranfield University
@@ -8,8 +6,11 @@ Author: Professor Stephen Hallett
 Configuration loading utilities for metadata export workflows.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 import csv
 
 
@@ -28,6 +29,21 @@ class MetadataExportConfig:
     include_keywords: bool = True
 
 
+# Recognised spellings for boolean CSV flags.
+_BOOL_VALUES: dict[str, bool] = {
+    "1": True,
+    "true": True,
+    "t": True,
+    "yes": True,
+    "y": True,
+    "0": False,
+    "false": False,
+    "f": False,
+    "no": False,
+    "n": False,
+}
+
+
 def _parse_bool(value: str | None, default: bool) -> bool:
     """Convert a string value to a boolean, falling back to a default.
 
@@ -38,58 +54,154 @@ def _parse_bool(value: str | None, default: bool) -> bool:
     Returns:
         Normalised boolean reflecting the input or default.
     """
-    if value is None or value == "":
+    if not value:
         return default
-    normalised = value.strip().lower()
-    if normalised in {"1", "true", "t", "yes", "y"}:
-        return True
-    if normalised in {"0", "false", "f", "no", "n"}:
-        return False
-    return default
+    return _BOOL_VALUES.get(value.strip().lower(), default)
 
 
-def load_configurations(csv_path: str | Path) -> list[MetadataExportConfig]:
-    """Load export configurations from a CSV file path.
+def _column_index(header: list[str], name: str) -> int | None:
+    """Locate an optional column in the CSV header.
 
     Parameters:
-        csv_path: Filesystem path to the configuration CSV.
+        header: Column names read from the first CSV line.
+        name: Column to locate.
 
     Returns:
-        Collection of export configuration records.
+        Zero-based column position, or None when the column is absent.
+    """
+    return header.index(name) if name in header else None
 
-    Notes:
-        Lines beginning with '#' are treated as comments and ignored.
+
+def _cell(row: list[str], index: int | None) -> str:
+    """Return a cell value by position, tolerating short rows and absent columns.
+
+    Parameters:
+        row: Parsed CSV row.
+        index: Column position, or None when the column is not defined.
+
+    Returns:
+        Cell text, or an empty string when no value is present.
     """
-    path = Path(csv_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Configuration CSV not found: {path}")
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
+
+
+def _iter_csv_configurations(path: Path) -> Iterator[MetadataExportConfig]:
+    """Yield export configurations from a CSV file one row at a time.
 
-    configurations: list[MetadataExportConfig] = []
+    Parameters:
+        path: Filesystem path to an existing configuration CSV.
+
+    Yields:
+        Export configuration records in file order.
+
+    Raises:
+        ValueError: When headers or metadata identifiers are missing, or the
+            file contains no records.
+    """
+    found = False
     with path.open(newline="", encoding="utf-8") as handle:
         non_comment_lines = (
             line for line in handle if not line.lstrip().startswith("#")
         )
-        reader = csv.DictReader(non_comment_lines)
-        if reader.fieldnames is None:
+        reader = csv.reader(non_comment_lines)
+        header = next(reader, None)
+        if header is None:
             raise ValueError("Configuration CSV must define column headers.")
+        if "metadata_id" not in header:
+            raise ValueError("Configuration CSV must define a 'metadata_id' column.")
+
+        id_index = header.index("metadata_id")
+        sources_index = _column_index(header, "include_sources")
+        keywords_index = _column_index(header, "include_keywords")
 
         for row_number, row in enumerate(reader, start=2):
-            metadata_id = (row.get("metadata_id") or "").strip()
+            if not row:
+                continue
+            metadata_id = _cell(row, id_index).strip()
             if not metadata_id:
                 raise ValueError(
                     f"Row {row_number} missing mandatory 'metadata_id' value."
                 )
 
-            include_sources = _parse_bool(row.get("include_sources"), default=True)
-            include_keywords = _parse_bool(row.get("include_keywords"), default=True)
-            configurations.append(
-                MetadataExportConfig(
-                    metadata_id=metadata_id,
-                    include_sources=include_sources,
-                    include_keywords=include_keywords,
-                )
+            include_sources = _parse_bool(_cell(row, sources_index), default=True)
+            include_keywords = _parse_bool(_cell(row, keywords_index), default=True)
+            found = True
+            yield MetadataExportConfig(
+                metadata_id=metadata_id,
+                include_sources=include_sources,
+                include_keywords=include_keywords,
             )
-    if not configurations:
+    if not found:
         raise ValueError("Configuration CSV did not contain any metadata records.")
-    return configurations
 
+
+def _existing_path(csv_path: str | Path) -> Path:
+    """Resolve the configuration CSV path, checking that the file exists.
+
+    Parameters:
+        csv_path: Filesystem path to the configuration CSV.
+
+    Returns:
+        Path to the configuration CSV.
+
+    Raises:
+        FileNotFoundError: When the configuration file is missing.
+    """
+    path = Path(csv_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Configuration CSV not found: {path}")
+    return path
+
+
+def iter_configurations(csv_path: str | Path) -> Iterator[MetadataExportConfig]:
+    """Stream export configurations from a CSV file path.
+
+    The file is parsed twice: once in full to validate every row before the
+    first record is returned, and again lazily as the records are consumed.
+    A malformed row therefore fails the call rather than a run that has
+    already written output for earlier rows, and the records are never held
+    in memory together.
+
+    Parameters:
+        csv_path: Filesystem path to the configuration CSV.
+
+    Returns:
+        Iterator over export configuration records in file order.
+
+    Raises:
+        FileNotFoundError: When the configuration file is missing.
+        ValueError: When headers or metadata identifiers are missing, or the
+            file contains no records.
+
+    Notes:
+        Lines beginning with '#' are treated as comments and ignored.
+    """
+    path = _existing_path(csv_path)
+    for _ in _iter_csv_configurations(path):
+        pass
+    return _iter_csv_configurations(path)
+
+
+def load_configurations(csv_path: str | Path) -> list[MetadataExportConfig]:
+    """Load export configurations from a CSV file path.
+
+    Unlike `iter_configurations`, the file is parsed only once, since the
+    complete list is validated as it is built.
+
+    Parameters:
+        csv_path: Filesystem path to the configuration CSV.
+
+    Returns:
+        Collection of export configuration records.
+
+    Raises:
+        FileNotFoundError: When the configuration file is missing.
+        ValueError: When headers or metadata identifiers are missing, or the
+            file contains no records.
+
+    Notes:
+        Lines beginning with '#' are treated as comments and ignored.
+    """
+    return list(_iter_csv_configurations(_existing_path(csv_path)))
@@ -9,11 +9,34 @@ Database access helpers for retrieving LandIS metadata assets.
 from __future__ import annotations
 
 import os
-from typing import Any
-import importlib
+from typing import Any, Callable, Iterable, Sequence
+import weakref
+
+from .config_loader import MetadataExportConfig
+
+try:
+    import oracledb as _oracledb
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    _oracledb = None  # type: ignore[assignment]
 
 Connection = Any
 Cursor = Any
+ConnectionPool = Any
+
+# Identifier lists are bound as a single SYS.ODCIVARCHAR2LIST collection so the
+# statement text stays constant; the VARRAY holds at most 32767 elements.
+_ID_LIST_TYPE_NAME = "SYS.ODCIVARCHAR2LIST"
+_ID_LIST_LIMIT = 32767
+_ID_LIST_TYPES: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+
+# Lowercase column names per statement text; every query here has fixed columns.
+_COLUMN_NAMES: dict[str, tuple[str, ...]] = {}
+
+# Rows fetched per round-trip for list-returning queries. Prefetching one row
+# more than the array size lets the final fetch detect end-of-data without an
+# extra round-trip.
+_FETCH_ARRAY_SIZE = 1000
+_FETCH_PREFETCH_ROWS = _FETCH_ARRAY_SIZE + 1
 
 
 def init_oracle_client_if_available() -> None:
@@ -29,7 +52,7 @@ def init_oracle_client_if_available() -> None:
 
 
 def _get_driver() -> Any:
-    """Import the python-oracledb driver, raising a helpful error if missing.
+    """Return the python-oracledb driver, raising a helpful error if missing.
 
     Returns:
         Loaded python-oracledb module reference.
@@ -37,24 +60,22 @@ def _get_driver() -> Any:
     Raises:
         ModuleNotFoundError: If python-oracledb is not installed.
     """
-    try:
-        return importlib.import_module("oracledb")
-    except ModuleNotFoundError:  # pragma: no cover - safety for missing dependency
+    if _oracledb is None:  # pragma: no cover - safety for missing dependency
         raise ModuleNotFoundError(
             "python-oracledb is required. Install it with `pip install oracledb`."
         )
+    return _oracledb
 
 
-def create_connection() -> "Connection":
-    """Create a database connection using Oracle-related environment variables.
+def _connection_parameters() -> dict[str, str]:
+    """Read Oracle credentials from the environment.
 
     Returns:
-        Active Oracle database connection.
+        Mapping of user, password, and dsn keyword arguments for the driver.
 
     Raises:
         EnvironmentError: If required credentials are absent.
     """
-    driver = _get_driver()
     user = os.environ.get("ORACLE_USER")
     password = os.environ.get("ORACLE_PASSWORD")
     dsn = os.environ.get("ORACLE_DSN")
@@ -63,22 +84,246 @@ def create_connection() -> "Connection":
         raise EnvironmentError(
             "Environment variables ORACLE_USER, ORACLE_PASSWORD, and ORACLE_DSN must be set."
         )
+    return {"user": user, "password": password, "dsn": dsn}
+
+
+def create_connection() -> "Connection":
+    """Create a database connection using Oracle-related environment variables.
+
+    Returns:
+        Active Oracle database connection.
+
+    Raises:
+        EnvironmentError: If required credentials are absent.
+    """
+    driver = _get_driver()
+    parameters = _connection_parameters()
+    init_oracle_client_if_available()
+    return driver.connect(**parameters)
+
+
+def create_pool(max_size: int, min_size: int = 1) -> "ConnectionPool":
+    """Create a session pool using Oracle-related environment variables.
 
+    Parameters:
+        max_size: Maximum number of pooled sessions.
+        min_size: Number of sessions opened when the pool is created.
+
+    Returns:
+        Oracle connection pool; acquire connections with `pool.acquire()`.
+
+    Raises:
+        EnvironmentError: If required credentials are absent.
+    """
+    driver = _get_driver()
+    parameters = _connection_parameters()
     init_oracle_client_if_available()
-    return driver.connect(user=user, password=password, dsn=dsn)
+    return driver.create_pool(
+        min=min(min_size, max_size), max=max_size, increment=1, **parameters
+    )
+
+
+def enable_parallel_dml(connection: "Connection") -> bool:
+    """Enable parallel DML for the session when the user is permitted to.
+
+    Parameters:
+        connection: Active Oracle database connection.
+
+    Returns:
+        True when parallel DML was enabled, False when Oracle refused it.
+    """
+    driver = _get_driver()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("ALTER SESSION ENABLE PARALLEL DML")
+    except driver.DatabaseError:
+        return False
+    return True
+
+
+def fetch_database_character_set(connection: "Connection") -> str:
+    """Return the database character set (NLS_CHARACTERSET).
+
+    Parameters:
+        connection: Active Oracle database connection.
+
+    Returns:
+        Character set name, for example `AL32UTF8`.
+    """
+    sql = """
+        SELECT VALUE
+        FROM NLS_DATABASE_PARAMETERS
+        WHERE PARAMETER = 'NLS_CHARACTERSET'
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        (character_set,) = cursor.fetchone()
+    return character_set
+
+
+def _cursor(connection: "Connection") -> "Cursor":
+    """Open a cursor tuned for queries returning many rows.
+
+    Parameters:
+        connection: Active Oracle database connection.
+
+    Returns:
+        Cursor with enlarged fetch array and prefetch sizes.
+    """
+    cursor = connection.cursor()
+    cursor.arraysize = _FETCH_ARRAY_SIZE
+    cursor.prefetchrows = _FETCH_PREFETCH_ROWS
+    cursor.outputtypehandler = _inline_lob_handler
+    return cursor
+
+
+def _inline_lob_handler(
+    cursor: "Cursor",
+    name: str,
+    default_type: Any,
+    size: int,
+    precision: int,
+    scale: int,
+) -> Any:
+    """Fetch character LOB columns inline as strings.
+
+    Without this, each CLOB value is returned as a LOB locator that needs its
+    own round-trip to read, and the XML builder expects plain text anyway.
+
+    Parameters:
+        cursor: Cursor whose query is being described.
+        name: Column name.
+        default_type: Database type the driver would otherwise use.
+        size: Column size.
+        precision: Numeric precision.
+        scale: Numeric scale.
+
+    Returns:
+        Variable fetching the column as a long string, or None for defaults.
+    """
+    driver = _get_driver()
+    if default_type is driver.DB_TYPE_CLOB:
+        return cursor.var(driver.DB_TYPE_LONG, arraysize=cursor.arraysize)
+    if default_type is driver.DB_TYPE_NCLOB:
+        return cursor.var(driver.DB_TYPE_LONG_NVARCHAR, arraysize=cursor.arraysize)
+    return None
 
 
-def _rows_to_dicts(cursor: "Cursor") -> list[dict[str, Any]]:
+def _rows_to_dicts(cursor: "Cursor", sql: str) -> list[dict[str, Any]]:
     """Convert database cursor rows into dictionaries keyed by column name.
 
+    A row factory is installed on the executed cursor so the driver builds
+    each dictionary as the row is fetched, without a second pass in Python.
+
     Parameters:
-        cursor: Database cursor containing row data and description metadata.
+        cursor: Executed database cursor containing row data and description
+            metadata.
+        sql: Statement text the cursor executed, used to cache column names.
 
     Returns:
         Normalised rows keyed by lowercase column names.
     """
-    column_names = [description[0].lower() for description in cursor.description]
-    return [dict(zip(column_names, row, strict=True)) for row in cursor]
+    column_names = _COLUMN_NAMES.get(sql)
+    if column_names is None:
+        column_names = tuple(
+            description[0].lower() for description in cursor.description
+        )
+        _COLUMN_NAMES[sql] = column_names
+    # Rows always match the description, so the per-row strict check is skipped.
+    cursor.rowfactory = lambda *row: dict(zip(column_names, row))
+    return cursor.fetchall()
+
+
+def _id_list_type(connection: "Connection") -> Any:
+    """Return the SYS.ODCIVARCHAR2LIST collection type for a connection.
+
+    Parameters:
+        connection: Active Oracle database connection.
+
+    Returns:
+        Driver object type used to bind identifier lists as a single value.
+    """
+    try:
+        return _ID_LIST_TYPES[connection]
+    except KeyError:
+        id_list_type = connection.gettype(_ID_LIST_TYPE_NAME)
+        _ID_LIST_TYPES[connection] = id_list_type
+        return id_list_type
+
+
+def _fetch_for_ids(
+    cursor: "Cursor", sql: str, values: Iterable[Any]
+) -> list[dict[str, Any]]:
+    """Run a query filtered by a bound collection of distinct identifiers.
+
+    The statement text is constant whatever the number of identifiers, so
+    Oracle's shared pool and the driver's statement cache are reused.
+
+    Parameters:
+        cursor: Tuned cursor to run the query on; see `_cursor`.
+        sql: Statement filtering with `IN (SELECT COLUMN_VALUE FROM TABLE(:ids))`.
+        values: Identifiers to bind; duplicates are removed preserving order.
+
+    Returns:
+        Rows matching any of the identifiers, as dictionaries.
+    """
+    unique_values = [str(value) for value in dict.fromkeys(values)]
+    id_list_type = _id_list_type(cursor.connection)
+    rows: list[dict[str, Any]] = []
+    cursor.prepare(sql)
+    for start in range(0, len(unique_values), _ID_LIST_LIMIT):
+        ids = id_list_type.newobject(unique_values[start : start + _ID_LIST_LIMIT])
+        cursor.execute(None, ids=ids)
+        rows.extend(_rows_to_dicts(cursor, sql))
+    return rows
+
+
+def _group_rows(
+    rows: Iterable[dict[str, Any]],
+    key: str,
+    sort_key: Callable[[dict[str, Any]], Any] | None = None,
+) -> dict[Any, list[dict[str, Any]]]:
+    """Group rows into lists keyed by the value of a column.
+
+    Parameters:
+        rows: Rows returned by a query.
+        key: Lowercase column name to group by.
+        sort_key: Optional key used to order the rows within each group.
+
+    Returns:
+        Mapping from column value to the rows sharing it, in original order
+        unless a sort key is supplied.
+    """
+    grouped: dict[Any, list[dict[str, Any]]] = {}
+    for row in rows:
+        grouped.setdefault(row[key], []).append(row)
+    if sort_key is not None:
+        for group in grouped.values():
+            group.sort(key=sort_key)
+    return grouped
+
+
+# Child rows are ordered client-side rather than with ORDER BY, so Oracle can
+# stream them without a sort step. Each key mirrors the former ORDER BY with
+# Oracle's default of nulls last.
+def _attribute_sort_key(row: dict[str, Any]) -> tuple[Any, ...]:
+    """Order attributes by number (nulls last) and then name."""
+    number = row["attribute_no"]
+    name = row["attribute_name"]
+    return (number is None, number or 0, name is None, name or "")
+
+
+def _keyword_sort_key(row: dict[str, Any]) -> tuple[Any, ...]:
+    """Order keywords by type and then keyword text (nulls last)."""
+    keyword_type = row["keyword_type"]
+    keyword = row["keyword"]
+    return (keyword_type is None, keyword_type or "", keyword is None, keyword or "")
+
+
+def _source_sort_key(row: dict[str, Any]) -> Any:
+    """Order sources by their METADATA_MAIN_SOURCE link identifier."""
+    return row["id"]
 
 
 def fetch_main_record(
@@ -118,7 +363,7 @@ def fetch_main_record(
 
     with connection.cursor() as cursor:
         cursor.execute(sql, metadata_id=metadata_id)
-        rows = _rows_to_dicts(cursor)
+        rows = _rows_to_dicts(cursor, sql)
     return rows[0] if rows else None
 
 
@@ -148,7 +393,7 @@ def fetch_group(connection: "Connection", group_id: str) -> dict[str, Any] | Non
 
     with connection.cursor() as cursor:
         cursor.execute(sql, group_id=group_id)
-        rows = _rows_to_dicts(cursor)
+        rows = _rows_to_dicts(cursor, sql)
     return rows[0] if rows else None
 
 
@@ -164,6 +409,22 @@ def fetch_contacts_for_ids(
     Returns:
         Mapping from contact identifier to contact detail dictionaries.
     """
+    with _cursor(connection) as cursor:
+        return _fetch_contacts_for_ids(cursor, contact_ids)
+
+
+def _fetch_contacts_for_ids(
+    cursor: "Cursor", contact_ids: list[int | str]
+) -> dict[int | str, dict[str, Any]]:
+    """Cursor-level form of `fetch_contacts_for_ids`, for reuse within a batch.
+
+    Parameters:
+        cursor: Tuned cursor shared by the batch's queries.
+        contact_ids: See `fetch_contacts_for_ids`.
+
+    Returns:
+        See `fetch_contacts_for_ids`.
+    """
     if not contact_ids:
         return {}
 
@@ -185,16 +446,9 @@ def fetch_contacts_for_ids(
             HOURS_OF_SERVICE,
             CONTACT_INSTRUCTIONS
         FROM ADMIN.METADATA_CONTACTS
-        WHERE CONTACT_ID IN ({placeholders})
+        WHERE CONTACT_ID IN (SELECT COLUMN_VALUE FROM TABLE(:ids))
     """
-    placeholders = ", ".join([f":id{i}" for i in range(len(contact_ids))])
-    formatted_sql = sql.format(placeholders=placeholders)
-    bindings = {f"id{i}": contact_id for i, contact_id in enumerate(contact_ids)}
-
-    with connection.cursor() as cursor:
-        cursor.execute(formatted_sql, bindings)
-        rows = _rows_to_dicts(cursor)
-
+    rows = _fetch_for_ids(cursor, sql, contact_ids)
     return {row["contact_id"]: row for row in rows}
 
 
@@ -229,7 +483,7 @@ def fetch_citation(
 
     with connection.cursor() as cursor:
         cursor.execute(sql, citation_id=citation_id)
-        rows = _rows_to_dicts(cursor)
+        rows = _rows_to_dicts(cursor, sql)
     return rows[0] if rows else None
 
 
@@ -259,12 +513,13 @@ def fetch_attributes(
             CODESET_NAME
         FROM ADMIN.METADATA_ATTRIBUTES
         WHERE METADATA_ID = :metadata_id
-        ORDER BY ATTRIBUTE_NO NULLS LAST, ATTRIBUTE_NAME
     """
 
-    with connection.cursor() as cursor:
+    with _cursor(connection) as cursor:
         cursor.execute(sql, metadata_id=metadata_id)
-        return _rows_to_dicts(cursor)
+        rows = _rows_to_dicts(cursor, sql)
+    rows.sort(key=_attribute_sort_key)
+    return rows
 
 
 def fetch_keywords(
@@ -286,12 +541,13 @@ def fetch_keywords(
             KEYWORD
         FROM ADMIN.METADATA_KEYWORDS
         WHERE METADATA_ID = :metadata_id
-        ORDER BY KEYWORD_TYPE, KEYWORD
     """
 
-    with connection.cursor() as cursor:
+    with _cursor(connection) as cursor:
         cursor.execute(sql, metadata_id=metadata_id)
-        return _rows_to_dicts(cursor)
+        rows = _rows_to_dicts(cursor, sql)
+    rows.sort(key=_keyword_sort_key)
+    return rows
 
 
 def fetch_sources(
@@ -320,12 +576,13 @@ def fetch_sources(
         JOIN ADMIN.METADATA_SOURCES s
             ON s.SOURCE_ID = ms.SOURCE_ID
         WHERE ms.METADATA_ID = :metadata_id
-        ORDER BY ms.ID
     """
 
-    with connection.cursor() as cursor:
+    with _cursor(connection) as cursor:
         cursor.execute(sql, metadata_id=metadata_id)
-        return _rows_to_dicts(cursor)
+        rows = _rows_to_dicts(cursor, sql)
+    rows.sort(key=_source_sort_key)
+    return rows
 
 
 def fetch_source_citations(
@@ -340,6 +597,22 @@ def fetch_source_citations(
     Returns:
         Mapping from source identifier to citation rows.
     """
+    with _cursor(connection) as cursor:
+        return _fetch_source_citations(cursor, source_ids)
+
+
+def _fetch_source_citations(
+    cursor: "Cursor", source_ids: list[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Cursor-level form of `fetch_source_citations`, for reuse within a batch.
+
+    Parameters:
+        cursor: Tuned cursor shared by the batch's queries.
+        source_ids: See `fetch_source_citations`.
+
+    Returns:
+        See `fetch_source_citations`.
+    """
     if not source_ids:
         return {}
 
@@ -348,21 +621,11 @@ def fetch_source_citations(
             SOURCE_ID,
             CITATION_ID
         FROM ADMIN.METADATA_SOURCE_CITATION
-        WHERE SOURCE_ID IN ({placeholders})
+        WHERE SOURCE_ID IN (SELECT COLUMN_VALUE FROM TABLE(:ids))
         ORDER BY SOURCE_ID
     """
-    placeholders = ", ".join([f":id{i}" for i in range(len(source_ids))])
-    formatted_sql = sql.format(placeholders=placeholders)
-    bindings = {f"id{i}": source_id for i, source_id in enumerate(source_ids)}
-
-    with connection.cursor() as cursor:
-        cursor.execute(formatted_sql, bindings)
-        rows = _rows_to_dicts(cursor)
-
-    grouped: dict[str, list[dict[str, Any]]] = {}
-    for row in rows:
-        grouped.setdefault(row["source_id"], []).append(row)
-    return grouped
+    rows = _fetch_for_ids(cursor, sql, source_ids)
+    return _group_rows(rows, "source_id")
 
 
 def fetch_citations_for_ids(
@@ -377,6 +640,22 @@ def fetch_citations_for_ids(
     Returns:
         Mapping from citation identifier to citation details.
     """
+    with _cursor(connection) as cursor:
+        return _fetch_citations_for_ids(cursor, citation_ids)
+
+
+def _fetch_citations_for_ids(
+    cursor: "Cursor", citation_ids: list[str]
+) -> dict[str, dict[str, Any]]:
+    """Cursor-level form of `fetch_citations_for_ids`, for reuse within a batch.
+
+    Parameters:
+        cursor: Tuned cursor shared by the batch's queries.
+        citation_ids: See `fetch_citations_for_ids`.
+
+    Returns:
+        See `fetch_citations_for_ids`.
+    """
     if not citation_ids:
         return {}
 
@@ -394,17 +673,487 @@ def fetch_citations_for_ids(
             PUBLISHER,
             ONLINE_LINKAGE
         FROM ADMIN.METADATA_CITATIONS
-        WHERE CITATION_ID IN ({placeholders})
+        WHERE CITATION_ID IN (SELECT COLUMN_VALUE FROM TABLE(:ids))
     """
-    placeholders = ", ".join([f":id{i}" for i in range(len(citation_ids))])
-    formatted_sql = sql.format(placeholders=placeholders)
-    bindings = {f"id{i}": citation_id for i, citation_id in enumerate(citation_ids)}
+    rows = _fetch_for_ids(cursor, sql, citation_ids)
+    return {row["citation_id"]: row for row in rows}
 
-    with connection.cursor() as cursor:
-        cursor.execute(formatted_sql, bindings)
-        rows = _rows_to_dicts(cursor)
 
-    return {row["citation_id"]: row for row in rows}
+def _split_joined_row(
+    row: dict[str, Any], prefixes: Sequence[str]
+) -> dict[str, dict[str, Any]]:
+    """Split a flat joined row into per-table dictionaries by column prefix.
+
+    Parameters:
+        row: Row whose column names start with one of the supplied prefixes.
+        prefixes: Column prefixes identifying each joined table.
+
+    Returns:
+        Mapping from prefix to the columns carrying it, with the prefix removed.
+    """
+    parts: dict[str, dict[str, Any]] = {prefix: {} for prefix in prefixes}
+    for column, value in row.items():
+        prefix, _, name = column.partition("_")
+        parts[prefix][name] = value
+    return parts
+
+
+def fetch_main_group_citation_contacts(
+    connection: "Connection", metadata_ids: Sequence[str]
+) -> dict[str, dict[str, Any]]:
+    """Fetch main records with their group, citation, and contacts in one query.
+
+    METADATA_MAIN is left-joined to METADATA_GROUPS, METADATA_CITATIONS, and
+    two copies of METADATA_CONTACTS (group and metadata contacts) so every
+    scalar lookup for a record arrives in a single round-trip.
+
+    Parameters:
+        connection: Active Oracle database connection.
+        metadata_ids: Metadata identifiers to locate.
+
+    Returns:
+        Mapping from metadata identifier to a dictionary with `main`, `group`,
+        `citation`, `group_contact`, and `metadata_contact` entries. Joined
+        entries are None when the related record is absent. A `has_children`
+        entry flags whether any `attributes`, `keywords`, or `sources` rows
+        exist, so callers can skip lookups that would return nothing.
+    """
+    with _cursor(connection) as cursor:
+        return _fetch_main_group_citation_contacts(cursor, metadata_ids)
+
+
+def _fetch_main_group_citation_contacts(
+    cursor: "Cursor", metadata_ids: Sequence[str]
+) -> dict[str, dict[str, Any]]:
+    """Cursor-level form of `fetch_main_group_citation_contacts`.
+
+    Parameters:
+        cursor: Tuned cursor shared by the batch's queries.
+        metadata_ids: See `fetch_main_group_citation_contacts`.
+
+    Returns:
+        See `fetch_main_group_citation_contacts`.
+    """
+    if not metadata_ids:
+        return {}
+
+    sql = """
+        SELECT
+            m.METADATA_ID AS M_METADATA_ID,
+            m.GROUP_ID AS M_GROUP_ID,
+            m.TITLE AS M_TITLE,
+            m.ABSTRACT AS M_ABSTRACT,
+            m.SUPPLEMENTAL_INFORMATION AS M_SUPPLEMENTAL_INFORMATION,
+            m.CITATION_ID AS M_CITATION_ID,
+            m.PUBLICATION_DATE AS M_PUBLICATION_DATE,
+            m.STATUS_PROGRESS AS M_STATUS_PROGRESS,
+            m.UPDATE_FREQUENCY AS M_UPDATE_FREQUENCY,
+            m.SECURITY_CLASSIFICATION AS M_SECURITY_CLASSIFICATION,
+            m.WEST_BOUNDING_COORDINATE AS M_WEST_BOUNDING_COORDINATE,
+            m.EAST_BOUNDING_COORDINATE AS M_EAST_BOUNDING_COORDINATE,
+            m.NORTH_BOUNDING_COORDINATE AS M_NORTH_BOUNDING_COORDINATE,
+            m.SOUTH_BOUNDING_COORDINATE AS M_SOUTH_BOUNDING_COORDINATE,
+            m.TEMPORAL_DATE_FROM AS M_TEMPORAL_DATE_FROM,
+            m.TEMPORAL_DATE_TO AS M_TEMPORAL_DATE_TO,
+            m.METADATA_FACING AS M_METADATA_FACING,
+            g.GROUP_ID AS G_GROUP_ID,
+            g.USE_CONSTRAINT AS G_USE_CONSTRAINT,
+            g.ACCESS_CONSTRAINT AS G_ACCESS_CONSTRAINT,
+            g.PURPOSE AS G_PURPOSE,
+            g.CONTACT_ID AS G_CONTACT_ID,
+            g.METADATA_CONTACT_ID AS G_METADATA_CONTACT_ID,
+            g.ATTRIBUTE_ACCURACY_REPORT AS G_ATTRIBUTE_ACCURACY_REPORT,
+            g.THUMBNAIL AS G_THUMBNAIL,
+            c.CITATION_ID AS C_CITATION_ID,
+            c.CITATION_TITLE AS C_CITATION_TITLE,
+            c.CITATION_ORIGINATOR AS C_CITATION_ORIGINATOR,
+            c.CITATION_PUBDATE AS C_CITATION_PUBDATE,
+            c.CITATION_EDITION AS C_CITATION_EDITION,
+            c.CITATION_DATA_FORM AS C_CITATION_DATA_FORM,
+            c.CITATION_SERIES AS C_CITATION_SERIES,
+            c.ISSUE_IDENTIFICATION AS C_ISSUE_IDENTIFICATION,
+            c.PUBLICATION_PLACE AS C_PUBLICATION_PLACE,
+            c.PUBLISHER AS C_PUBLISHER,
+            c.ONLINE_LINKAGE AS C_ONLINE_LINKAGE,
+            gc.CONTACT_ID AS GC_CONTACT_ID,
+            gc.CONTACT_ROLE AS GC_CONTACT_ROLE,
+            gc.INDIVIDUAL_NAME AS GC_INDIVIDUAL_NAME,
+            gc.ORGANISATION_NAME AS GC_ORGANISATION_NAME,
+            gc.POSITION_NAME AS GC_POSITION_NAME,
+            gc.VOICE_PHONE AS GC_VOICE_PHONE,
+            gc.FACSIMILE_PHONE AS GC_FACSIMILE_PHONE,
+            gc.DELIVERY_POINT AS GC_DELIVERY_POINT,
+            gc.CITY AS GC_CITY,
+            gc.ADMINISTRATIVE_AREA AS GC_ADMINISTRATIVE_AREA,
+            gc.POSTAL_CODE AS GC_POSTAL_CODE,
+            gc.COUNTRY AS GC_COUNTRY,
+            gc.ELECTRONIC_MAIL_ADDRESS AS GC_ELECTRONIC_MAIL_ADDRESS,
+            gc.HOURS_OF_SERVICE AS GC_HOURS_OF_SERVICE,
+            gc.CONTACT_INSTRUCTIONS AS GC_CONTACT_INSTRUCTIONS,
+            mc.CONTACT_ID AS MC_CONTACT_ID,
+            mc.CONTACT_ROLE AS MC_CONTACT_ROLE,
+            mc.INDIVIDUAL_NAME AS MC_INDIVIDUAL_NAME,
+            mc.ORGANISATION_NAME AS MC_ORGANISATION_NAME,
+            mc.POSITION_NAME AS MC_POSITION_NAME,
+            mc.VOICE_PHONE AS MC_VOICE_PHONE,
+            mc.FACSIMILE_PHONE AS MC_FACSIMILE_PHONE,
+            mc.DELIVERY_POINT AS MC_DELIVERY_POINT,
+            mc.CITY AS MC_CITY,
+            mc.ADMINISTRATIVE_AREA AS MC_ADMINISTRATIVE_AREA,
+            mc.POSTAL_CODE AS MC_POSTAL_CODE,
+            mc.COUNTRY AS MC_COUNTRY,
+            mc.ELECTRONIC_MAIL_ADDRESS AS MC_ELECTRONIC_MAIL_ADDRESS,
+            mc.HOURS_OF_SERVICE AS MC_HOURS_OF_SERVICE,
+            mc.CONTACT_INSTRUCTIONS AS MC_CONTACT_INSTRUCTIONS,
+            CASE WHEN EXISTS (
+                SELECT 1 FROM ADMIN.METADATA_ATTRIBUTES a
+                WHERE a.METADATA_ID = m.METADATA_ID
+            ) THEN 1 ELSE 0 END AS HAS_ATTRIBUTES,
+            CASE WHEN EXISTS (
+                SELECT 1 FROM ADMIN.METADATA_KEYWORDS k
+                WHERE k.METADATA_ID = m.METADATA_ID
+            ) THEN 1 ELSE 0 END AS HAS_KEYWORDS,
+            CASE WHEN EXISTS (
+                SELECT 1 FROM ADMIN.METADATA_MAIN_SOURCE ms
+                WHERE ms.METADATA_ID = m.METADATA_ID
+            ) THEN 1 ELSE 0 END AS HAS_SOURCES
+        FROM ADMIN.METADATA_MAIN m
+        LEFT JOIN ADMIN.METADATA_GROUPS g
+            ON g.GROUP_ID = m.GROUP_ID
+        LEFT JOIN ADMIN.METADATA_CITATIONS c
+            ON c.CITATION_ID = m.CITATION_ID
+        LEFT JOIN ADMIN.METADATA_CONTACTS gc
+            ON gc.CONTACT_ID = g.CONTACT_ID
+        LEFT JOIN ADMIN.METADATA_CONTACTS mc
+            ON mc.CONTACT_ID = g.METADATA_CONTACT_ID
+        WHERE m.METADATA_ID IN (SELECT COLUMN_VALUE FROM TABLE(:ids))
+    """
+    records: dict[str, dict[str, Any]] = {}
+    for row in _fetch_for_ids(cursor, sql, metadata_ids):
+        parts = _split_joined_row(row, ("m", "g", "c", "gc", "mc", "has"))
+        main = parts["m"]
+        records[main["metadata_id"]] = {
+            "main": main,
+            "group": parts["g"] if parts["g"]["group_id"] is not None else None,
+            "citation": (
+                parts["c"] if parts["c"]["citation_id"] is not None else None
+            ),
+            "group_contact": (
+                parts["gc"] if parts["gc"]["contact_id"] is not None else None
+            ),
+            "metadata_contact": (
+                parts["mc"] if parts["mc"]["contact_id"] is not None else None
+            ),
+            "has_children": {
+                table: bool(flag) for table, flag in parts["has"].items()
+            },
+        }
+    return records
+
+
+def fetch_attributes_for_ids(
+    connection: "Connection", metadata_ids: Sequence[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Retrieve attribute metadata for a collection of metadata identifiers.
+
+    Parameters:
+        connection: Active Oracle database connection.
+        metadata_ids: Identifiers for the parent metadata records.
+
+    Returns:
+        Mapping from metadata identifier to its ordered attribute dictionaries.
+    """
+    with _cursor(connection) as cursor:
+        return _fetch_attributes_for_ids(cursor, metadata_ids)
+
+
+def _fetch_attributes_for_ids(
+    cursor: "Cursor", metadata_ids: Sequence[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Cursor-level form of `fetch_attributes_for_ids`, for reuse within a batch.
+
+    Parameters:
+        cursor: Tuned cursor shared by the batch's queries.
+        metadata_ids: See `fetch_attributes_for_ids`.
+
+    Returns:
+        See `fetch_attributes_for_ids`.
+    """
+    if not metadata_ids:
+        return {}
+
+    sql = """
+        SELECT
+            METADATA_ID,
+            ATTRIBUTE_NAME,
+            ATTRIBUTE_ALIAS,
+            ATTRIBUTE_NO,
+            ATTRIBUTE_DEFINITION,
+            ATTRIBUTE_TYPE,
+            ATTRIBUTE_WIDTH,
+            ATTRIBUTE_PRECISION,
+            ATTRIBUTE_SCALE,
+            CODESET_NAME
+        FROM ADMIN.METADATA_ATTRIBUTES
+        WHERE METADATA_ID IN (SELECT COLUMN_VALUE FROM TABLE(:ids))
+    """
+    rows = _fetch_for_ids(cursor, sql, metadata_ids)
+    return _group_rows(rows, "metadata_id", sort_key=_attribute_sort_key)
+
+
+def fetch_keywords_for_ids(
+    connection: "Connection", metadata_ids: Sequence[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Retrieve keyword metadata for a collection of metadata identifiers.
+
+    Parameters:
+        connection: Active Oracle database connection.
+        metadata_ids: Identifiers for the parent metadata records.
+
+    Returns:
+        Mapping from metadata identifier to its keyword dictionaries.
+    """
+    with _cursor(connection) as cursor:
+        return _fetch_keywords_for_ids(cursor, metadata_ids)
+
+
+def _fetch_keywords_for_ids(
+    cursor: "Cursor", metadata_ids: Sequence[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Cursor-level form of `fetch_keywords_for_ids`, for reuse within a batch.
+
+    Parameters:
+        cursor: Tuned cursor shared by the batch's queries.
+        metadata_ids: See `fetch_keywords_for_ids`.
+
+    Returns:
+        See `fetch_keywords_for_ids`.
+    """
+    if not metadata_ids:
+        return {}
+
+    sql = """
+        SELECT
+            METADATA_ID,
+            KEYWORD_TYPE,
+            KEYWORD
+        FROM ADMIN.METADATA_KEYWORDS
+        WHERE METADATA_ID IN (SELECT COLUMN_VALUE FROM TABLE(:ids))
+    """
+    rows = _fetch_for_ids(cursor, sql, metadata_ids)
+    return _group_rows(rows, "metadata_id", sort_key=_keyword_sort_key)
+
+
+def fetch_sources_for_ids(
+    connection: "Connection", metadata_ids: Sequence[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Retrieve source metadata for a collection of metadata identifiers.
+
+    Parameters:
+        connection: Active Oracle database connection.
+        metadata_ids: Identifiers for the parent metadata records.
+
+    Returns:
+        Mapping from metadata identifier to its source dictionaries.
+    """
+    with _cursor(connection) as cursor:
+        return _fetch_sources_for_ids(cursor, metadata_ids)
+
+
+def _fetch_sources_for_ids(
+    cursor: "Cursor", metadata_ids: Sequence[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Cursor-level form of `fetch_sources_for_ids`, for reuse within a batch.
+
+    Parameters:
+        cursor: Tuned cursor shared by the batch's queries.
+        metadata_ids: See `fetch_sources_for_ids`.
+
+    Returns:
+        See `fetch_sources_for_ids`.
+    """
+    if not metadata_ids:
+        return {}
+
+    sql = """
+        SELECT
+            ms.ID,
+            ms.METADATA_ID,
+            ms.SOURCE_ID,
+            s.SOURCE_NAME,
+            s.SOURCE_SCALE,
+            s.SOURCE_MEDIA,
+            s.SOURCE_CONTRIBUTION,
+            s.CITATION_ID
+        FROM ADMIN.METADATA_MAIN_SOURCE ms
+        JOIN ADMIN.METADATA_SOURCES s
+            ON s.SOURCE_ID = ms.SOURCE_ID
+        WHERE ms.METADATA_ID IN (SELECT COLUMN_VALUE FROM TABLE(:ids))
+    """
+    rows = _fetch_for_ids(cursor, sql, metadata_ids)
+    return _group_rows(rows, "metadata_id", sort_key=_source_sort_key)
+
+
+def _linked_citation_ids(
+    sources: Iterable[dict[str, Any]],
+    source_citation_map: dict[str, list[dict[str, Any]]],
+) -> set[Any]:
+    """Collect the citation identifiers referenced by a set of sources.
+
+    Parameters:
+        sources: Source rows, each optionally carrying a `citation_id`.
+        source_citation_map: Rows from METADATA_SOURCE_CITATION keyed by source.
+
+    Returns:
+        Citation identifiers linked directly or through the citation map.
+    """
+    linked_citation_ids = {
+        source["citation_id"] for source in sources if source.get("citation_id")
+    }
+    for rows in source_citation_map.values():
+        for row in rows:
+            linked_citation_ids.add(row["citation_id"])
+    return linked_citation_ids
+
+
+def fetch_metadata_bundles(
+    connection: "Connection",
+    configs: Sequence[MetadataExportConfig],
+    citation_cache: dict[str, dict[str, Any]] | None = None,
+) -> list[dict[str, Any] | None]:
+    """Compile metadata bundles for a batch of export configurations.
+
+    Each table is queried once for the whole batch using IN lists, and the
+    results are joined client-side into one bundle per configuration.
+
+    Parameters:
+        connection: Active Oracle database connection.
+        configs: Export configurations describing the records to fetch.
+        citation_cache: Optional mapping of citations already retrieved, shared
+            across batches of one export run. Citations found here are not
+            queried again, and newly fetched citations are added to it.
+
+    Returns:
+        Aggregated metadata bundles ready for XML serialisation, in the same
+        order as the supplied configurations. The entry for a metadata
+        identifier missing from METADATA_MAIN is None, so the other records in
+        the batch can still be exported.
+    """
+    # One tuned cursor serves every query in the batch.
+    with _cursor(connection) as cursor:
+        return _fetch_metadata_bundles(cursor, configs, citation_cache)
+
+
+def _fetch_metadata_bundles(
+    cursor: "Cursor",
+    configs: Sequence[MetadataExportConfig],
+    citation_cache: dict[str, dict[str, Any]] | None,
+) -> list[dict[str, Any] | None]:
+    """Cursor-level form of `fetch_metadata_bundles`.
+
+    Parameters:
+        cursor: Tuned cursor shared by the batch's queries.
+        configs: See `fetch_metadata_bundles`.
+        citation_cache: See `fetch_metadata_bundles`.
+
+    Returns:
+        See `fetch_metadata_bundles`.
+    """
+    records = _fetch_main_group_citation_contacts(
+        cursor, [config.metadata_id for config in configs]
+    )
+    found = [config for config in configs if config.metadata_id in records]
+
+    if citation_cache is None:
+        citation_cache = {}
+    for record in records.values():
+        if record["citation"] is not None:
+            citation_cache.setdefault(
+                record["citation"]["citation_id"], record["citation"]
+            )
+
+    # Only records known to have child rows are included in the lookups; a
+    # batch where none do skips the query altogether.
+    attributes = _fetch_attributes_for_ids(
+        cursor,
+        [
+            config.metadata_id
+            for config in found
+            if records[config.metadata_id]["has_children"]["attributes"]
+        ],
+    )
+    keywords = _fetch_keywords_for_ids(
+        cursor,
+        [
+            config.metadata_id
+            for config in found
+            if config.include_keywords
+            and records[config.metadata_id]["has_children"]["keywords"]
+        ],
+    )
+    sources = _fetch_sources_for_ids(
+        cursor,
+        [
+            config.metadata_id
+            for config in found
+            if config.include_sources
+            and records[config.metadata_id]["has_children"]["sources"]
+        ],
+    )
+
+    source_citation_map: dict[str, list[dict[str, Any]]] = {}
+    all_sources = [source for rows in sources.values() for source in rows]
+    if all_sources:
+        source_citation_map = _fetch_source_citations(
+            cursor, [source["source_id"] for source in all_sources]
+        )
+        missing_ids = {
+            citation_id
+            for citation_id in _linked_citation_ids(all_sources, source_citation_map)
+            if citation_id not in citation_cache
+        }
+        # The bound identifier list is order-independent, so no sort is needed.
+        citation_cache.update(_fetch_citations_for_ids(cursor, list(missing_ids)))
+
+    bundles: list[dict[str, Any] | None] = []
+    for config in configs:
+        record = records.get(config.metadata_id)
+        if record is None:
+            bundles.append(None)
+            continue
+        bundle: dict[str, Any] = {
+            "metadata_id": config.metadata_id,
+            "main": record["main"],
+            "group": record["group"],
+            "citation": record["citation"],
+            "group_contact": record["group_contact"],
+            "metadata_contact": record["metadata_contact"],
+        }
+        bundle["attributes"] = attributes.get(config.metadata_id, [])
+        bundle["keywords"] = (
+            keywords.get(config.metadata_id, []) if config.include_keywords else []
+        )
+        bundle_sources = (
+            sources.get(config.metadata_id, []) if config.include_sources else []
+        )
+        bundle["sources"] = bundle_sources
+        # Each bundle carries only the citations its own sources link to, so
+        # its contents do not depend on the other records in the batch.
+        bundle_citation_map = {
+            source["source_id"]: source_citation_map[source["source_id"]]
+            for source in bundle_sources
+            if source["source_id"] in source_citation_map
+        }
+        bundle["source_citations"] = bundle_citation_map
+        bundle["citation_lookup"] = {
+            citation_id: citation_cache[citation_id]
+            for citation_id in _linked_citation_ids(
+                bundle_sources, bundle_citation_map
+            )
+            if citation_id in citation_cache
+        }
+        bundles.append(bundle)
+    return bundles
 
 
 def fetch_metadata_bundle(
@@ -423,74 +1172,16 @@ def fetch_metadata_bundle(
 
     Returns:
         Aggregated metadata bundle ready for XML serialisation.
-    """
-    bundle: dict[str, Any] = {"metadata_id": metadata_id}
 
-    main = fetch_main_record(connection, metadata_id)
-    if main is None:
-        raise LookupError(f"Metadata ID '{metadata_id}' not found in METADATA_MAIN.")
-    bundle["main"] = main
-
-    group = None
-    if main.get("group_id"):
-        group = fetch_group(connection, main["group_id"])
-    bundle["group"] = group
-
-    main_citation = None
-    if main.get("citation_id"):
-        main_citation = fetch_citation(connection, main["citation_id"])
-    bundle["citation"] = main_citation
-
-    bundle["group_contact"] = None
-    bundle["metadata_contact"] = None
-
-    contact_ids: list[int | str] = []
-    if group:
-        if group.get("contact_id") is not None:
-            contact_ids.append(group["contact_id"])
-        if group.get("metadata_contact_id") is not None:
-            contact_ids.append(group["metadata_contact_id"])
-
-    contact_lookup: dict[int | str, dict[str, Any]] = {}
-    if contact_ids:
-        unique_ids = list(dict.fromkeys(contact_ids))
-        contact_lookup = fetch_contacts_for_ids(connection, unique_ids)
-
-    if group:
-        if group.get("contact_id") is not None:
-            bundle["group_contact"] = contact_lookup.get(group["contact_id"])
-        if group.get("metadata_contact_id") is not None:
-            bundle["metadata_contact"] = contact_lookup.get(
-                group["metadata_contact_id"]
-            )
-
-    bundle["attributes"] = fetch_attributes(connection, metadata_id)
-
-    bundle["keywords"] = (
-        fetch_keywords(connection, metadata_id) if include_keywords else []
+    Raises:
+        LookupError: When the metadata identifier is missing from METADATA_MAIN.
+    """
+    config = MetadataExportConfig(
+        metadata_id=metadata_id,
+        include_sources=include_sources,
+        include_keywords=include_keywords,
     )
-
-    sources = fetch_sources(connection, metadata_id) if include_sources else []
-    bundle["sources"] = sources
-
-    source_citation_map: dict[str, list[dict[str, Any]]] = {}
-    citation_lookup: dict[str, dict[str, Any]] = {}
-    if sources:
-        source_ids = [source["source_id"] for source in sources]
-        source_citation_map = fetch_source_citations(connection, source_ids)
-        linked_citation_ids = {
-            source["citation_id"]
-            for source in sources
-            if source.get("citation_id")
-        }
-        for rows in source_citation_map.values():
-            for row in rows:
-                linked_citation_ids.add(row["citation_id"])
-        citation_lookup = fetch_citations_for_ids(
-            connection, sorted(linked_citation_ids)
-        )
-
-    bundle["source_citations"] = source_citation_map
-    bundle["citation_lookup"] = citation_lookup
+    bundle = fetch_metadata_bundles(connection, [config])[0]
+    if bundle is None:
+        raise LookupError(f"Metadata ID '{metadata_id}' not found in METADATA_MAIN.")
     return bundle
-
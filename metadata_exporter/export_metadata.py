@@ -10,7 +10,13 @@ from __future__ import annotations
 
 import argparse
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from functools import partial
+from itertools import islice
 from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
 
 from . import config_loader, db, xml_builder
 
@@ -21,6 +27,9 @@ except ModuleNotFoundError:  # pragma: no cover - optional dependency
 
 LOGGER = logging.getLogger("metadata_exporter")
 
+# Metadata records fetched together; each table is queried once per batch.
+_EXPORT_BATCH_SIZE = 1000
+
 
 def parse_arguments() -> argparse.Namespace:
     """Define and parse command-line options for the exporter.
@@ -51,6 +60,12 @@ def parse_arguments() -> argparse.Namespace:
         default=".env",
         help="Path to .env file containing ORACLE_* variables (ignored if missing).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of batches fetched concurrently from an Oracle session pool.",
+    )
     return parser.parse_args()
 
 
@@ -110,46 +125,207 @@ def load_environment(env_file: Path | None) -> None:
     LOGGER.debug("Environment variables loaded from %s", env_file)
 
 
+def _fetch_pooled_batch(
+    pool: "db.ConnectionPool",
+    citation_cache: dict[str, dict[str, Any]],
+    batch: Sequence[config_loader.MetadataExportConfig],
+) -> list[dict[str, Any] | None]:
+    """Fetch the bundles for one batch on a pooled connection.
+
+    Parameters:
+        pool: Session pool supplying the connection.
+        citation_cache: Citations already retrieved during the export run.
+        batch: Export configurations to fetch together.
+
+    Returns:
+        Metadata bundles in the same order as the batch, with None for any
+        metadata identifier missing from METADATA_MAIN.
+    """
+    with pool.acquire() as connection:
+        return db.fetch_metadata_bundles(connection, batch, citation_cache)
+
+
+def _write_tree(tree: xml_builder.ET.ElementTree, output_path: Path) -> Path:
+    """Serialise an XML tree to disk.
+
+    Parameters:
+        tree: Formatted metadata tree.
+        output_path: Destination file path.
+
+    Returns:
+        The path written.
+    """
+    # The stdlib writer is kept deliberately: its elements are already C
+    # accelerated, and handing the tree to lxml would mean re-parsing it.
+    tree.write(output_path, encoding="utf-8", xml_declaration=True)
+    LOGGER.info("Wrote %s", output_path)
+    return output_path
+
+
+def _export_batch(
+    batch: Sequence[config_loader.MetadataExportConfig],
+    bundles: Sequence[dict[str, Any] | None],
+    output_directory: Path,
+    dry_run: bool,
+    writer: ThreadPoolExecutor,
+    options: xml_builder.BuildOptions,
+) -> list[Path]:
+    """Build the XML documents for one fetched batch and write them.
+
+    Each tree is handed to the writer thread so the next one can be built
+    while the previous file is serialised; the batch's writes are awaited
+    before returning.
+
+    Parameters:
+        batch: Export configurations in the batch.
+        bundles: Metadata bundles matching the batch order; None marks a
+            metadata identifier missing from METADATA_MAIN.
+        output_directory: Destination directory for generated XML files.
+        dry_run: When True, build the trees without writing them.
+        writer: Executor serialising trees to disk.
+        options: XML generation options shared by every record in the run.
+
+    Returns:
+        List of paths for the XML files written for the batch.
+
+    Raises:
+        LookupError: When a metadata identifier is missing from METADATA_MAIN.
+            The records listed before it are written first.
+    """
+    writes: list[Future[Path]] = []
+    for config, bundle in zip(batch, bundles):
+        if bundle is None:
+            for write in writes:
+                write.result()
+            raise LookupError(
+                f"Metadata ID '{config.metadata_id}' not found in METADATA_MAIN."
+            )
+        LOGGER.info("Exporting metadata ID %s", config.metadata_id)
+        tree = xml_builder.build_metadata_tree(bundle, options)
+        xml_builder.format_tree_for_output(tree)
+        if dry_run:
+            LOGGER.debug("Dry-run enabled; skipping write for %s", config.metadata_id)
+            continue
+
+        output_path = output_directory / f"{config.metadata_id}.xml"
+        writes.append(writer.submit(_write_tree, tree, output_path))
+    return [write.result() for write in writes]
+
+
+def _export_batches(
+    executor: ThreadPoolExecutor,
+    fetch_batch: Callable[
+        [list[config_loader.MetadataExportConfig]], list[dict[str, Any] | None]
+    ],
+    batches: Iterable[list[config_loader.MetadataExportConfig]],
+    max_pending: int,
+    output_directory: Path,
+    dry_run: bool,
+    options: xml_builder.BuildOptions,
+) -> list[Path]:
+    """Fetch batches on an executor and write them in configuration order.
+
+    Up to `max_pending` batches are fetched ahead of the one being written, so
+    database work overlaps XML building while memory stays bounded. Files are
+    serialised on a dedicated writer thread.
+
+    Parameters:
+        executor: Executor running the fetches.
+        fetch_batch: Callable returning the bundles for a batch.
+        batches: Batches of export configurations, consumed lazily.
+        max_pending: Number of batches fetched ahead of the one being written.
+        output_directory: Destination directory for generated XML files.
+        dry_run: When True, build the trees without writing them.
+        options: XML generation options shared by every record in the run.
+
+    Returns:
+        List of paths for the XML files written.
+    """
+    written_files: list[Path] = []
+    pending: deque[tuple[list[config_loader.MetadataExportConfig], Future]] = deque()
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        export = partial(
+            _export_batch,
+            output_directory=output_directory,
+            dry_run=dry_run,
+            writer=writer,
+            options=options,
+        )
+        for batch in batches:
+            pending.append((batch, executor.submit(fetch_batch, batch)))
+            if len(pending) > max_pending:
+                ready_batch, future = pending.popleft()
+                written_files.extend(export(ready_batch, future.result()))
+        while pending:
+            ready_batch, future = pending.popleft()
+            written_files.extend(export(ready_batch, future.result()))
+    return written_files
+
+
 def export_metadata_records(
-    configuration_path: Path, output_directory: Path, dry_run: bool = False
+    configuration_path: Path,
+    output_directory: Path,
+    dry_run: bool = False,
+    workers: int = 1,
 ) -> list[Path]:
     """Export metadata records to XML based on configuration entries.
 
+    The configuration CSV is streamed in batches. Batches are fetched in the
+    background while XML is built and written in configuration order on the
+    calling thread. With more than one worker, the batches are smaller and
+    fetched concurrently on pooled connections.
+
     Parameters:
         configuration_path: CSV file describing metadata identifiers to export.
         output_directory: Destination directory for generated XML files.
         dry_run: When True, skip file writing while exercising data retrieval.
+        workers: Number of batches fetched concurrently.
 
     Returns:
         List of paths for the XML files written during the session.
     """
-    configs = config_loader.load_configurations(configuration_path)
-    LOGGER.info("Loaded %s metadata configurations from %s", len(configs), configuration_path)
+    configs = config_loader.iter_configurations(configuration_path)
+    LOGGER.info("Reading metadata configurations from %s", configuration_path)
 
     ensure_output_directory(output_directory)
 
-    written_files: list[Path] = []
-    with db.create_connection() as connection:
-        for config in configs:
-            LOGGER.info("Exporting metadata ID %s", config.metadata_id)
-            bundle = db.fetch_metadata_bundle(
-                connection,
-                metadata_id=config.metadata_id,
-                include_sources=config.include_sources,
-                include_keywords=config.include_keywords,
+    workers = max(1, workers)
+    # Pooled workers share one full batch between them so that moderate
+    # exports still spread across every worker.
+    batch_size = max(1, _EXPORT_BATCH_SIZE // workers)
+    batches = iter(lambda: list(islice(configs, batch_size)), [])
+
+    # One date stamp for the run keeps records consistent across midnight.
+    options = xml_builder.BuildOptions(date_stamp=date.today())
+    # Citations are shared by many records, so keep them for the whole run.
+    citation_cache: dict[str, dict[str, Any]] = {}
+    if workers == 1:
+        # A single fetch thread means the connection is never shared.
+        with db.create_connection() as connection, ThreadPoolExecutor(
+            max_workers=1
+        ) as executor:
+            fetch_batch = partial(
+                db.fetch_metadata_bundles, connection, citation_cache=citation_cache
+            )
+            return _export_batches(
+                executor, fetch_batch, batches, 1, output_directory, dry_run, options
             )
 
-            tree = xml_builder.build_metadata_tree(bundle)
-            xml_builder.format_tree_for_output(tree)
-            if dry_run:
-                LOGGER.debug("Dry-run enabled; skipping write for %s", config.metadata_id)
-                continue
-
-            output_path = output_directory / f"{config.metadata_id}.xml"
-            tree.write(output_path, encoding="utf-8", xml_declaration=True)
-            LOGGER.info("Wrote %s", output_path)
-            written_files.append(output_path)
-    return written_files
+    pool = db.create_pool(max_size=workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetch_batch = partial(_fetch_pooled_batch, pool, citation_cache)
+            return _export_batches(
+                executor,
+                fetch_batch,
+                batches,
+                workers,
+                output_directory,
+                dry_run,
+                options,
+            )
+    finally:
+        pool.close()
 
 
 def main() -> None:
@@ -161,6 +337,7 @@ def main() -> None:
         configuration_path=Path(args.config),
         output_directory=Path(args.output_dir),
         dry_run=args.dry_run,
+        workers=args.workers,
     )
     if not args.dry_run:
         LOGGER.info("Export completed: %s files written.", len(exported))
@@ -8,9 +8,11 @@ XML construction utilities for ISO 19139 metadata serialisation.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any, Iterable
+import copy
 import xml.etree.ElementTree as ET
 
 NAMESPACES = {
@@ -39,19 +41,176 @@ def _qn(prefix: str, tag: str) -> str:
     return f"{{{NAMESPACES[prefix]}}}{tag}"
 
 
-def _character_string(text: str | None) -> ET.Element:
-    """Wrap text in a gco:CharacterString element, handling blank values.
+# Qualified tag names, expanded once at import rather than per element.
+GMD_ABSTRACT = _qn("gmd", "abstract")
+GMD_ACCESS_CONSTRAINTS = _qn("gmd", "accessConstraints")
+GMD_ADDRESS = _qn("gmd", "address")
+GMD_ADMINISTRATIVE_AREA = _qn("gmd", "administrativeArea")
+GMD_ALTERNATE_TITLE = _qn("gmd", "alternateTitle")
+GMD_CHARACTER_SET = _qn("gmd", "characterSet")
+GMD_CI_ADDRESS = _qn("gmd", "CI_Address")
+GMD_CI_CITATION = _qn("gmd", "CI_Citation")
+GMD_CI_CONTACT = _qn("gmd", "CI_Contact")
+GMD_CI_DATE = _qn("gmd", "CI_Date")
+GMD_CI_DATE_TYPE_CODE = _qn("gmd", "CI_DateTypeCode")
+GMD_CI_ONLINE_RESOURCE = _qn("gmd", "CI_OnlineResource")
+GMD_CI_RESPONSIBLE_PARTY = _qn("gmd", "CI_ResponsibleParty")
+GMD_CI_ROLE_CODE = _qn("gmd", "CI_RoleCode")
+GMD_CI_TELEPHONE = _qn("gmd", "CI_Telephone")
+GMD_CITATION = _qn("gmd", "citation")
+GMD_CITY = _qn("gmd", "city")
+GMD_CODE = _qn("gmd", "code")
+GMD_CONDITION = _qn("gmd", "condition")
+GMD_CONTACT = _qn("gmd", "contact")
+GMD_CONTACT_INFO = _qn("gmd", "contactInfo")
+GMD_CONTACT_INSTRUCTIONS = _qn("gmd", "contactInstructions")
+GMD_COUNTRY = _qn("gmd", "country")
+GMD_DATA_QUALITY_INFO = _qn("gmd", "dataQualityInfo")
+GMD_DATA_TYPE = _qn("gmd", "dataType")
+GMD_DATE = _qn("gmd", "date")
+GMD_DATE_STAMP = _qn("gmd", "dateStamp")
+GMD_DATE_TYPE = _qn("gmd", "dateType")
+GMD_DEFINITION = _qn("gmd", "definition")
+GMD_DELIVERY_POINT = _qn("gmd", "deliveryPoint")
+GMD_DENOMINATOR = _qn("gmd", "denominator")
+GMD_DESCRIPTION = _qn("gmd", "description")
+GMD_DESCRIPTIVE_KEYWORDS = _qn("gmd", "descriptiveKeywords")
+GMD_DISTRIBUTION_FORMAT = _qn("gmd", "distributionFormat")
+GMD_DISTRIBUTION_INFO = _qn("gmd", "distributionInfo")
+GMD_DQ_CONFORMANCE_RESULT = _qn("gmd", "DQ_ConformanceResult")
+GMD_DQ_DATA_QUALITY = _qn("gmd", "DQ_DataQuality")
+GMD_DQ_DOMAIN_CONSISTENCY = _qn("gmd", "DQ_DomainConsistency")
+GMD_DQ_SCOPE = _qn("gmd", "DQ_Scope")
+GMD_EAST_BOUND_LONGITUDE = _qn("gmd", "eastBoundLongitude")
+GMD_ELECTRONIC_MAIL_ADDRESS = _qn("gmd", "electronicMailAddress")
+GMD_EX_EXTENT = _qn("gmd", "EX_Extent")
+GMD_EX_GEOGRAPHIC_BOUNDING_BOX = _qn("gmd", "EX_GeographicBoundingBox")
+GMD_EX_TEMPORAL_EXTENT = _qn("gmd", "EX_TemporalExtent")
+GMD_EXPLANATION = _qn("gmd", "explanation")
+GMD_EXTENDED_ELEMENT_INFORMATION = _qn("gmd", "extendedElementInformation")
+GMD_EXTENT = _qn("gmd", "extent")
+GMD_FACSIMILE = _qn("gmd", "facsimile")
+GMD_FILE_IDENTIFIER = _qn("gmd", "fileIdentifier")
+GMD_GEOGRAPHIC_ELEMENT = _qn("gmd", "geographicElement")
+GMD_HIERARCHY_LEVEL = _qn("gmd", "hierarchyLevel")
+GMD_HOURS_OF_SERVICE = _qn("gmd", "hoursOfService")
+GMD_IDENTIFICATION_INFO = _qn("gmd", "identificationInfo")
+GMD_INDIVIDUAL_NAME = _qn("gmd", "individualName")
+GMD_KEYWORD = _qn("gmd", "keyword")
+GMD_LANGUAGE = _qn("gmd", "language")
+GMD_LANGUAGE_CODE = _qn("gmd", "LanguageCode")
+GMD_LEVEL = _qn("gmd", "level")
+GMD_LI_LINEAGE = _qn("gmd", "LI_Lineage")
+GMD_LI_SOURCE = _qn("gmd", "LI_Source")
+GMD_LINEAGE = _qn("gmd", "lineage")
+GMD_LINKAGE = _qn("gmd", "linkage")
+GMD_MD_CHARACTER_SET_CODE = _qn("gmd", "MD_CharacterSetCode")
+GMD_MD_CONSTRAINTS = _qn("gmd", "MD_Constraints")
+GMD_MD_DATA_IDENTIFICATION = _qn("gmd", "MD_DataIdentification")
+GMD_MD_DISTRIBUTION = _qn("gmd", "MD_Distribution")
+GMD_MD_FORMAT = _qn("gmd", "MD_Format")
+GMD_MD_KEYWORDS = _qn("gmd", "MD_Keywords")
+GMD_MD_KEYWORD_TYPE_CODE = _qn("gmd", "MD_KeywordTypeCode")
+GMD_MD_LEGAL_CONSTRAINTS = _qn("gmd", "MD_LegalConstraints")
+GMD_MD_METADATA = _qn("gmd", "MD_Metadata")
+GMD_MD_METADATA_EXTENSION_INFORMATION = _qn("gmd", "MD_MetadataExtensionInformation")
+GMD_MD_PROGRESS_CODE = _qn("gmd", "MD_ProgressCode")
+GMD_MD_REFERENCE_SYSTEM = _qn("gmd", "MD_ReferenceSystem")
+GMD_MD_REPRESENTATIVE_FRACTION = _qn("gmd", "MD_RepresentativeFraction")
+GMD_MD_RESTRICTION_CODE = _qn("gmd", "MD_RestrictionCode")
+GMD_MD_SCOPE_CODE = _qn("gmd", "MD_ScopeCode")
+GMD_MD_SPATIAL_REPRESENTATION_TYPE_CODE = _qn("gmd", "MD_SpatialRepresentationTypeCode")
+GMD_METADATA_EXTENSION_INFO = _qn("gmd", "metadataExtensionInfo")
+GMD_NAME = _qn("gmd", "name")
+GMD_NORTH_BOUND_LATITUDE = _qn("gmd", "northBoundLatitude")
+GMD_ONLINE_RESOURCE = _qn("gmd", "onlineResource")
+GMD_ORGANISATION_NAME = _qn("gmd", "organisationName")
+GMD_PASS = _qn("gmd", "pass")
+GMD_PHONE = _qn("gmd", "phone")
+GMD_POSITION_NAME = _qn("gmd", "positionName")
+GMD_POSTAL_CODE = _qn("gmd", "postalCode")
+GMD_PURPOSE = _qn("gmd", "purpose")
+GMD_REFERENCE_SYSTEM_IDENTIFIER = _qn("gmd", "referenceSystemIdentifier")
+GMD_REFERENCE_SYSTEM_INFO = _qn("gmd", "referenceSystemInfo")
+GMD_REPORT = _qn("gmd", "report")
+GMD_RESOURCE_CONSTRAINTS = _qn("gmd", "resourceConstraints")
+GMD_RESULT = _qn("gmd", "result")
+GMD_ROLE = _qn("gmd", "role")
+GMD_RS_IDENTIFIER = _qn("gmd", "RS_Identifier")
+GMD_SCOPE = _qn("gmd", "scope")
+GMD_SHORT_NAME = _qn("gmd", "shortName")
+GMD_SOURCE = _qn("gmd", "source")
+GMD_SOURCE_CITATION = _qn("gmd", "sourceCitation")
+GMD_SOURCE_SCALE = _qn("gmd", "sourceScale")
+GMD_SOUTH_BOUND_LATITUDE = _qn("gmd", "southBoundLatitude")
+GMD_SPATIAL_REPRESENTATION_TYPE = _qn("gmd", "spatialRepresentationType")
+GMD_STATUS = _qn("gmd", "status")
+GMD_TEMPORAL_ELEMENT = _qn("gmd", "temporalElement")
+GMD_TITLE = _qn("gmd", "title")
+GMD_TYPE = _qn("gmd", "type")
+GMD_URL = _qn("gmd", "URL")
+GMD_USE_LIMITATION = _qn("gmd", "useLimitation")
+GMD_VERSION = _qn("gmd", "version")
+GMD_VOICE = _qn("gmd", "voice")
+GMD_WEST_BOUND_LONGITUDE = _qn("gmd", "westBoundLongitude")
+GCO_BOOLEAN = _qn("gco", "Boolean")
+GCO_CHARACTER_STRING = _qn("gco", "CharacterString")
+GCO_DATE = _qn("gco", "Date")
+GCO_DECIMAL = _qn("gco", "Decimal")
+GML_BEGIN_POSITION = _qn("gml", "beginPosition")
+GML_END_POSITION = _qn("gml", "endPosition")
+GML_TIME_PERIOD = _qn("gml", "TimePeriod")
+
+# Bounding box children in west, east, south, north order.
+_BOUNDING_BOX_TAGS = (
+    GMD_WEST_BOUND_LONGITUDE,
+    GMD_EAST_BOUND_LONGITUDE,
+    GMD_SOUTH_BOUND_LATITUDE,
+    GMD_NORTH_BOUND_LATITUDE,
+)
+
+
+# Code list locations, joined once at import for the codeList attributes.
+_GMX_CODE_LISTS = (
+    "http://standards.iso.org/ittf/PubliclyAvailableStandards/"
+    "ISO_19139_Schemas/resources/Codelist/ML_gmxCodelists.xml"
+)
+_ISO_CODE_LISTS = "http://www.isotc211.org/2005/resources/codeList.xml"
+_LANGUAGE_CODE_LIST = f"{_GMX_CODE_LISTS}#LanguageCode"
+_HIERARCHY_SCOPE_CODE_LIST = f"{_GMX_CODE_LISTS}#MD_ScopeCode"
+_RESTRICTION_CODE_LIST = f"{_GMX_CODE_LISTS}#MD_RestrictionCode"
+_CHARACTER_SET_CODE_LIST = f"{_ISO_CODE_LISTS}#MD_CharacterSetCode"
+_ROLE_CODE_LIST = f"{_ISO_CODE_LISTS}#CI_RoleCode"
+_DATE_TYPE_CODE_LIST = f"{_ISO_CODE_LISTS}#CI_DateTypeCode"
+_PROGRESS_CODE_LIST = f"{_ISO_CODE_LISTS}#MD_ProgressCode"
+_KEYWORD_TYPE_CODE_LIST = f"{_ISO_CODE_LISTS}#MD_KeywordTypeCode"
+_SPATIAL_REPRESENTATION_TYPE_CODE_LIST = (
+    f"{_ISO_CODE_LISTS}#MD_SpatialRepresentationTypeCode"
+)
+_SCOPE_CODE_LIST = f"{_ISO_CODE_LISTS}#MD_ScopeCode"
+
+# Attributes for fixed code values; SubElement copies them per element.
+_PUBLICATION_DATE_TYPE_ATTRIBUTES = {
+    "codeList": _DATE_TYPE_CODE_LIST,
+    "codeListValue": "publication",
+}
+_DATASET_SCOPE_ATTRIBUTES = {"codeList": _SCOPE_CODE_LIST, "codeListValue": "dataset"}
+
+
+def _text_child(parent: ET.Element, tag: str, text: str | None) -> ET.Element:
+    """Attach a child element wrapping its text in a gco:CharacterString.
 
     Parameters:
+        parent: Element that will receive the child.
+        tag: Qualified tag name for the child element.
         text: Raw string content to wrap; blanks result in empty elements.
 
     Returns:
-        Element containing the provided text or remaining empty.
+        The child element added to the parent.
     """
-    element = ET.Element(_qn("gco", "CharacterString"))
-    if text is not None:
-        element.text = text
-    return element
+    child = ET.SubElement(parent, tag)
+    ET.SubElement(child, GCO_CHARACTER_STRING).text = text
+    return child
 
 
 def format_tree_for_output(tree: ET.ElementTree, space: str = "    ") -> None:
@@ -95,22 +254,42 @@ def _indent_fallback(element: ET.Element | None, level: int, space: str) -> None
             element.tail = indent
 
 
-def _optional_element(parent: ET.Element, prefix: str, tag: str, text: str | None) -> None:
+def _optional_element(parent: ET.Element, tag: str, text: str | None) -> None:
     """Attach a text element when text is supplied, otherwise skip creation.
 
     Parameters:
         parent: Element that will receive the child.
-        prefix: Namespace prefix for the child element.
-        tag: Tag name for the child element.
+        tag: Qualified tag name for the child element.
         text: Optional text to include within the child.
 
     Returns:
         None. Modifies the parent element in place.
     """
-    if text is None or text == "":
+    if not text:
         return
-    child = ET.SubElement(parent, _qn(prefix, tag))
-    child.append(_character_string(text))
+    child = ET.SubElement(parent, tag)
+    ET.SubElement(child, GCO_CHARACTER_STRING).text = text
+
+
+def _code_list_element(
+    parent: ET.Element, tag: str, code_list: str, value: str
+) -> ET.Element:
+    """Attach a code list value element carrying its codeList attributes.
+
+    Parameters:
+        parent: Element that will receive the child.
+        tag: Qualified tag name for the code element.
+        code_list: Code list URL identifying the value's vocabulary.
+        value: Code list value, also used as the element text.
+
+    Returns:
+        The code element added to the parent.
+    """
+    element = ET.SubElement(
+        parent, tag, {"codeList": code_list, "codeListValue": value}
+    )
+    element.text = value
+    return element
 
 
 def _format_date(value: Any) -> str | None:
@@ -122,12 +301,18 @@ def _format_date(value: Any) -> str | None:
     Returns:
         ISO formatted date string, or None when conversion is not possible.
     """
+    # Exact type checks first: drivers return plain dates and datetimes.
+    if value.__class__ is date:
+        return value.isoformat()
+    if value.__class__ is datetime:
+        return value.date().isoformat()
     if value is None:
         return None
-    if isinstance(value, date):
-        return value.isoformat()
+    # datetime subclasses date, so it must be tested first.
     if isinstance(value, datetime):
         return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
     text = str(value).strip()
     return text or None
 
@@ -167,7 +352,7 @@ def build_metadata_tree(bundle: dict[str, Any], options: BuildOptions | None = N
     """
     options = options or BuildOptions()
 
-    root = ET.Element(_qn("gmd", "MD_Metadata"))
+    root = ET.Element(GMD_MD_METADATA)
 
     _build_file_identifier(root, bundle)
     _build_language(root, options.language_code)
@@ -194,8 +379,7 @@ def _build_file_identifier(root: ET.Element, bundle: dict[str, Any]) -> None:
     Returns:
         None. Updates the XML tree in place.
     """
-    file_identifier = ET.SubElement(root, _qn("gmd", "fileIdentifier"))
-    file_identifier.append(_character_string(bundle["metadata_id"]))
+    _text_child(root, GMD_FILE_IDENTIFIER, bundle["metadata_id"])
 
 
 def _build_language(root: ET.Element, language_code: str) -> None:
@@ -208,11 +392,8 @@ def _build_language(root: ET.Element, language_code: str) -> None:
     Returns:
         None. Updates the XML tree in place.
     """
-    language = ET.SubElement(root, _qn("gmd", "language"))
-    lang_code_element = ET.SubElement(language, _qn("gmd", "LanguageCode"))
-    lang_code_element.set("codeList", "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/Codelist/ML_gmxCodelists.xml#LanguageCode")
-    lang_code_element.set("codeListValue", language_code)
-    lang_code_element.text = language_code
+    language = ET.SubElement(root, GMD_LANGUAGE)
+    _code_list_element(language, GMD_LANGUAGE_CODE, _LANGUAGE_CODE_LIST, language_code)
 
 
 def _build_character_set(root: ET.Element, character_set: str) -> None:
@@ -225,10 +406,12 @@ def _build_character_set(root: ET.Element, character_set: str) -> None:
     Returns:
         None. Updates the XML tree in place.
     """
-    character_set_element = ET.SubElement(root, _qn("gmd", "characterSet"))
-    charset = ET.SubElement(character_set_element, _qn("gmd", "MD_CharacterSetCode"))
-    charset.set("codeList", "http://www.isotc211.org/2005/resources/codeList.xml#MD_CharacterSetCode")
-    charset.set("codeListValue", character_set)
+    character_set_element = ET.SubElement(root, GMD_CHARACTER_SET)
+    ET.SubElement(
+        character_set_element,
+        GMD_MD_CHARACTER_SET_CODE,
+        {"codeList": _CHARACTER_SET_CODE_LIST, "codeListValue": character_set},
+    )
 
 
 def _build_hierarchy_level(root: ET.Element, hierarchy_level: str) -> None:
@@ -241,11 +424,13 @@ def _build_hierarchy_level(root: ET.Element, hierarchy_level: str) -> None:
     Returns:
         None. Updates the XML tree in place.
     """
-    hierarchy_level_element = ET.SubElement(root, _qn("gmd", "hierarchyLevel"))
-    scope = ET.SubElement(hierarchy_level_element, _qn("gmd", "MD_ScopeCode"))
-    scope.set("codeList", "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/Codelist/ML_gmxCodelists.xml#MD_ScopeCode")
-    scope.set("codeListValue", hierarchy_level)
-    scope.text = hierarchy_level
+    hierarchy_level_element = ET.SubElement(root, GMD_HIERARCHY_LEVEL)
+    _code_list_element(
+        hierarchy_level_element,
+        GMD_MD_SCOPE_CODE,
+        _HIERARCHY_SCOPE_CODE_LIST,
+        hierarchy_level,
+    )
 
 
 def _build_contact(root: ET.Element, bundle: dict[str, Any], options: BuildOptions) -> None:
@@ -259,8 +444,8 @@ def _build_contact(root: ET.Element, bundle: dict[str, Any], options: BuildOptio
     Returns:
         None. Updates the XML tree in place.
     """
-    contact_element = ET.SubElement(root, _qn("gmd", "contact"))
-    responsible_party = ET.SubElement(contact_element, _qn("gmd", "CI_ResponsibleParty"))
+    contact_element = ET.SubElement(root, GMD_CONTACT)
+    responsible_party = ET.SubElement(contact_element, GMD_CI_RESPONSIBLE_PARTY)
 
     contact_details = bundle.get("metadata_contact") or bundle.get("group_contact") or {}
 
@@ -273,9 +458,9 @@ def _build_contact(root: ET.Element, bundle: dict[str, Any], options: BuildOptio
     )
     position_name = contact_details.get("position_name")
 
-    _optional_element(responsible_party, "gmd", "individualName", contact_name)
-    _optional_element(responsible_party, "gmd", "organisationName", contact_organisation)
-    _optional_element(responsible_party, "gmd", "positionName", position_name)
+    _optional_element(responsible_party, GMD_INDIVIDUAL_NAME, contact_name)
+    _optional_element(responsible_party, GMD_ORGANISATION_NAME, contact_organisation)
+    _optional_element(responsible_party, GMD_POSITION_NAME, position_name)
 
     voice_phone = contact_details.get("voice_phone")
     facsimile_phone = contact_details.get("facsimile_phone")
@@ -296,40 +481,36 @@ def _build_contact(root: ET.Element, bundle: dict[str, Any], options: BuildOptio
     )
 
     if has_phone_details or has_address_details or has_additional_contact:
-        contact_info = ET.SubElement(responsible_party, _qn("gmd", "contactInfo"))
-        ci_contact = ET.SubElement(contact_info, _qn("gmd", "CI_Contact"))
+        contact_info = ET.SubElement(responsible_party, GMD_CONTACT_INFO)
+        ci_contact = ET.SubElement(contact_info, GMD_CI_CONTACT)
 
         if has_phone_details:
-            phone = ET.SubElement(ci_contact, _qn("gmd", "phone"))
-            ci_telephone = ET.SubElement(phone, _qn("gmd", "CI_Telephone"))
-            _optional_element(ci_telephone, "gmd", "voice", voice_phone)
-            _optional_element(ci_telephone, "gmd", "facsimile", facsimile_phone)
+            phone = ET.SubElement(ci_contact, GMD_PHONE)
+            ci_telephone = ET.SubElement(phone, GMD_CI_TELEPHONE)
+            _optional_element(ci_telephone, GMD_VOICE, voice_phone)
+            _optional_element(ci_telephone, GMD_FACSIMILE, facsimile_phone)
 
         if has_address_details or contact_email:
-            address = ET.SubElement(ci_contact, _qn("gmd", "address"))
-            ci_address = ET.SubElement(address, _qn("gmd", "CI_Address"))
-            _optional_element(ci_address, "gmd", "deliveryPoint", delivery_point)
-            _optional_element(ci_address, "gmd", "city", city)
+            address = ET.SubElement(ci_contact, GMD_ADDRESS)
+            ci_address = ET.SubElement(address, GMD_CI_ADDRESS)
+            _optional_element(ci_address, GMD_DELIVERY_POINT, delivery_point)
+            _optional_element(ci_address, GMD_CITY, city)
             _optional_element(
-                ci_address, "gmd", "administrativeArea", administrative_area
+                ci_address, GMD_ADMINISTRATIVE_AREA, administrative_area
             )
-            _optional_element(ci_address, "gmd", "postalCode", postal_code)
-            _optional_element(ci_address, "gmd", "country", country)
+            _optional_element(ci_address, GMD_POSTAL_CODE, postal_code)
+            _optional_element(ci_address, GMD_COUNTRY, country)
             if contact_email:
-                email = ET.SubElement(ci_address, _qn("gmd", "electronicMailAddress"))
-                email.append(_character_string(contact_email))
+                _text_child(ci_address, GMD_ELECTRONIC_MAIL_ADDRESS, contact_email)
 
-        _optional_element(ci_contact, "gmd", "hoursOfService", hours_of_service)
+        _optional_element(ci_contact, GMD_HOURS_OF_SERVICE, hours_of_service)
         _optional_element(
-            ci_contact, "gmd", "contactInstructions", contact_instructions
+            ci_contact, GMD_CONTACT_INSTRUCTIONS, contact_instructions
         )
 
-    role = ET.SubElement(responsible_party, _qn("gmd", "role"))
-    role_code = ET.SubElement(role, _qn("gmd", "CI_RoleCode"))
-    role_code.set("codeList", "http://www.isotc211.org/2005/resources/codeList.xml#CI_RoleCode")
+    role = ET.SubElement(responsible_party, GMD_ROLE)
     role_value = contact_details.get("contact_role") or "pointOfContact"
-    role_code.set("codeListValue", role_value)
-    role_code.text = role_value
+    _code_list_element(role, GMD_CI_ROLE_CODE, _ROLE_CODE_LIST, role_value)
 
 
 def _build_date_stamp(root: ET.Element, date_stamp: date | None) -> None:
@@ -347,8 +528,8 @@ def _build_date_stamp(root: ET.Element, date_stamp: date | None) -> None:
     else:
         date_value = date_stamp
 
-    date_stamp_element = ET.SubElement(root, _qn("gmd", "dateStamp"))
-    date_element = ET.SubElement(date_stamp_element, _qn("gco", "Date"))
+    date_stamp_element = ET.SubElement(root, GMD_DATE_STAMP)
+    date_element = ET.SubElement(date_stamp_element, GCO_DATE)
     date_element.text = date_value.isoformat()
 
 
@@ -361,12 +542,11 @@ def _build_reference_system(root: ET.Element) -> None:
     Returns:
         None. Updates the XML tree in place.
     """
-    reference_system_info = ET.SubElement(root, _qn("gmd", "referenceSystemInfo"))
-    md_reference_system = ET.SubElement(reference_system_info, _qn("gmd", "MD_ReferenceSystem"))
-    identifier = ET.SubElement(md_reference_system, _qn("gmd", "referenceSystemIdentifier"))
-    rs_identifier = ET.SubElement(identifier, _qn("gmd", "RS_Identifier"))
-    code = ET.SubElement(rs_identifier, _qn("gmd", "code"))
-    code.append(_character_string("British National Grid"))
+    reference_system_info = ET.SubElement(root, GMD_REFERENCE_SYSTEM_INFO)
+    md_reference_system = ET.SubElement(reference_system_info, GMD_MD_REFERENCE_SYSTEM)
+    identifier = ET.SubElement(md_reference_system, GMD_REFERENCE_SYSTEM_IDENTIFIER)
+    rs_identifier = ET.SubElement(identifier, GMD_RS_IDENTIFIER)
+    _text_child(rs_identifier, GMD_CODE, "British National Grid")
 
 
 def _build_identification_info(root: ET.Element, bundle: dict[str, Any]) -> None:
@@ -384,60 +564,57 @@ def _build_identification_info(root: ET.Element, bundle: dict[str, Any]) -> None
     citation = bundle.get("citation")
     keywords = bundle.get("keywords", [])
 
-    identification_info = ET.SubElement(root, _qn("gmd", "identificationInfo"))
-    data_identification = ET.SubElement(identification_info, _qn("gmd", "MD_DataIdentification"))
+    identification_info = ET.SubElement(root, GMD_IDENTIFICATION_INFO)
+    data_identification = ET.SubElement(identification_info, GMD_MD_DATA_IDENTIFICATION)
 
-    citation_element = ET.SubElement(data_identification, _qn("gmd", "citation"))
-    ci_citation = ET.SubElement(citation_element, _qn("gmd", "CI_Citation"))
+    citation_element = ET.SubElement(data_identification, GMD_CITATION)
+    ci_citation = ET.SubElement(citation_element, GMD_CI_CITATION)
 
-    title = ET.SubElement(ci_citation, _qn("gmd", "title"))
-    title.append(_character_string(main.get("title")))
+    _text_child(ci_citation, GMD_TITLE, main.get("title"))
 
     if citation:
-        _optional_element(ci_citation, "gmd", "alternateTitle", citation.get("citation_title"))
-        date_element = ET.SubElement(ci_citation, _qn("gmd", "date"))
-        ci_date = ET.SubElement(date_element, _qn("gmd", "CI_Date"))
+        _optional_element(ci_citation, GMD_ALTERNATE_TITLE, citation.get("citation_title"))
+        date_element = ET.SubElement(ci_citation, GMD_DATE)
+        ci_date = ET.SubElement(date_element, GMD_CI_DATE)
         publication_date = _format_date(citation.get("citation_pubdate"))
         if publication_date:
-            date_value = ET.SubElement(ci_date, _qn("gmd", "date"))
-            date_value.append(_character_string(publication_date))
-        date_type = ET.SubElement(ci_date, _qn("gmd", "dateType"))
-        date_type_code = ET.SubElement(date_type, _qn("gmd", "CI_DateTypeCode"))
-        date_type_code.set("codeList", "http://www.isotc211.org/2005/resources/codeList.xml#CI_DateTypeCode")
-        date_type_code.set("codeListValue", "publication")
+            _text_child(ci_date, GMD_DATE, publication_date)
+        date_type = ET.SubElement(ci_date, GMD_DATE_TYPE)
+        date_type_code = ET.SubElement(
+            date_type, GMD_CI_DATE_TYPE_CODE, _PUBLICATION_DATE_TYPE_ATTRIBUTES
+        )
         date_type_code.text = "publication"
 
-    abstract = ET.SubElement(data_identification, _qn("gmd", "abstract"))
-    abstract.append(_character_string(main.get("abstract")))
+    _text_child(data_identification, GMD_ABSTRACT, main.get("abstract"))
 
     if group and group.get("purpose"):
-        purpose = ET.SubElement(data_identification, _qn("gmd", "purpose"))
-        purpose.append(_character_string(group["purpose"]))
+        _text_child(data_identification, GMD_PURPOSE, group["purpose"])
     elif main.get("supplemental_information"):
-        supplemental = ET.SubElement(data_identification, _qn("gmd", "purpose"))
-        supplemental.append(_character_string(main["supplemental_information"]))
+        _text_child(
+            data_identification, GMD_PURPOSE, main["supplemental_information"]
+        )
 
     status_value = main.get("status_progress")
     if status_value:
-        status = ET.SubElement(data_identification, _qn("gmd", "status"))
-        progress = ET.SubElement(status, _qn("gmd", "MD_ProgressCode"))
-        progress.set("codeList", "http://www.isotc211.org/2005/resources/codeList.xml#MD_ProgressCode")
-        progress.set("codeListValue", status_value)
-        progress.text = status_value
+        status = ET.SubElement(data_identification, GMD_STATUS)
+        _code_list_element(
+            status, GMD_MD_PROGRESS_CODE, _PROGRESS_CODE_LIST, status_value
+        )
 
     if keywords:
         for keyword_group, group_keywords in _group_keywords_by_type(keywords).items():
-            descriptive_keywords = ET.SubElement(data_identification, _qn("gmd", "descriptiveKeywords"))
-            md_keywords = ET.SubElement(descriptive_keywords, _qn("gmd", "MD_Keywords"))
+            descriptive_keywords = ET.SubElement(data_identification, GMD_DESCRIPTIVE_KEYWORDS)
+            md_keywords = ET.SubElement(descriptive_keywords, GMD_MD_KEYWORDS)
             for keyword in group_keywords:
-                keyword_element = ET.SubElement(md_keywords, _qn("gmd", "keyword"))
-                keyword_element.append(_character_string(keyword["keyword"]))
+                _text_child(md_keywords, GMD_KEYWORD, keyword["keyword"])
             if keyword_group:
-                keyword_type = ET.SubElement(md_keywords, _qn("gmd", "type"))
-                keyword_code = ET.SubElement(keyword_type, _qn("gmd", "MD_KeywordTypeCode"))
-                keyword_code.set("codeList", "http://www.isotc211.org/2005/resources/codeList.xml#MD_KeywordTypeCode")
-                keyword_code.set("codeListValue", keyword_group)
-                keyword_code.text = keyword_group
+                keyword_type = ET.SubElement(md_keywords, GMD_TYPE)
+                _code_list_element(
+                    keyword_type,
+                    GMD_MD_KEYWORD_TYPE_CODE,
+                    _KEYWORD_TYPE_CODE_LIST,
+                    keyword_group,
+                )
 
     _build_constraints(data_identification, group)
     _build_spatial_representation(data_identification, main)
@@ -453,10 +630,9 @@ def _group_keywords_by_type(keywords: Iterable[dict[str, Any]]) -> dict[str, lis
     Returns:
         Mapping between keyword type and list of keyword records.
     """
-    grouped: dict[str, list[dict[str, Any]]] = {}
+    grouped: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
     for keyword in keywords:
-        keyword_type = (keyword.get("keyword_type") or "").strip()
-        grouped.setdefault(keyword_type, []).append(keyword)
+        grouped[(keyword.get("keyword_type") or "").strip()].append(keyword)
     return grouped
 
 
@@ -474,19 +650,20 @@ def _build_constraints(parent: ET.Element, group: dict[str, Any] | None) -> None
         return
 
     if group.get("use_constraint"):
-        constraint = ET.SubElement(parent, _qn("gmd", "resourceConstraints"))
-        md_constraints = ET.SubElement(constraint, _qn("gmd", "MD_Constraints"))
-        use_limitation = ET.SubElement(md_constraints, _qn("gmd", "useLimitation"))
-        use_limitation.append(_character_string(group["use_constraint"]))
+        constraint = ET.SubElement(parent, GMD_RESOURCE_CONSTRAINTS)
+        md_constraints = ET.SubElement(constraint, GMD_MD_CONSTRAINTS)
+        _text_child(md_constraints, GMD_USE_LIMITATION, group["use_constraint"])
 
     if group.get("access_constraint"):
-        legal_constraint = ET.SubElement(parent, _qn("gmd", "resourceConstraints"))
-        md_legal = ET.SubElement(legal_constraint, _qn("gmd", "MD_LegalConstraints"))
-        access_constraints = ET.SubElement(md_legal, _qn("gmd", "accessConstraints"))
-        restriction = ET.SubElement(access_constraints, _qn("gmd", "MD_RestrictionCode"))
-        restriction.set("codeList", "http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/Codelist/ML_gmxCodelists.xml#MD_RestrictionCode")
-        restriction.set("codeListValue", group["access_constraint"])
-        restriction.text = group["access_constraint"]
+        legal_constraint = ET.SubElement(parent, GMD_RESOURCE_CONSTRAINTS)
+        md_legal = ET.SubElement(legal_constraint, GMD_MD_LEGAL_CONSTRAINTS)
+        access_constraints = ET.SubElement(md_legal, GMD_ACCESS_CONSTRAINTS)
+        _code_list_element(
+            access_constraints,
+            GMD_MD_RESTRICTION_CODE,
+            _RESTRICTION_CODE_LIST,
+            group["access_constraint"],
+        )
 
 
 def _build_spatial_representation(parent: ET.Element, main: dict[str, Any]) -> None:
@@ -503,11 +680,13 @@ def _build_spatial_representation(parent: ET.Element, main: dict[str, Any]) -> N
     if not spatial_type:
         return
 
-    representation = ET.SubElement(parent, _qn("gmd", "spatialRepresentationType"))
-    spatial_code = ET.SubElement(representation, _qn("gmd", "MD_SpatialRepresentationTypeCode"))
-    spatial_code.set("codeList", "http://www.isotc211.org/2005/resources/codeList.xml#MD_SpatialRepresentationTypeCode")
-    spatial_code.set("codeListValue", spatial_type)
-    spatial_code.text = spatial_type
+    representation = ET.SubElement(parent, GMD_SPATIAL_REPRESENTATION_TYPE)
+    _code_list_element(
+        representation,
+        GMD_MD_SPATIAL_REPRESENTATION_TYPE_CODE,
+        _SPATIAL_REPRESENTATION_TYPE_CODE_LIST,
+        spatial_type,
+    )
 
 
 def _build_extent(parent: ET.Element, main: dict[str, Any]) -> None:
@@ -526,38 +705,32 @@ def _build_extent(parent: ET.Element, main: dict[str, Any]) -> None:
         main.get("south_bounding_coordinate"),
         main.get("north_bounding_coordinate"),
     )
-    if not any(value is not None for value in bounds):
+    if all(value is None for value in bounds):
         return
 
-    extent = ET.SubElement(parent, _qn("gmd", "extent"))
-    ex_extent = ET.SubElement(extent, _qn("gmd", "EX_Extent"))
-    geographic_element = ET.SubElement(ex_extent, _qn("gmd", "geographicElement"))
-    bbox = ET.SubElement(geographic_element, _qn("gmd", "EX_GeographicBoundingBox"))
-
-    names = [
-        ("westBoundLongitude", main.get("west_bounding_coordinate")),
-        ("eastBoundLongitude", main.get("east_bounding_coordinate")),
-        ("southBoundLatitude", main.get("south_bounding_coordinate")),
-        ("northBoundLatitude", main.get("north_bounding_coordinate")),
-    ]
-    for tag, value in names:
+    extent = ET.SubElement(parent, GMD_EXTENT)
+    ex_extent = ET.SubElement(extent, GMD_EX_EXTENT)
+    geographic_element = ET.SubElement(ex_extent, GMD_GEOGRAPHIC_ELEMENT)
+    bbox = ET.SubElement(geographic_element, GMD_EX_GEOGRAPHIC_BOUNDING_BOX)
+
+    for tag, value in zip(_BOUNDING_BOX_TAGS, bounds):
         if value is None:
             continue
-        element = ET.SubElement(bbox, _qn("gmd", tag))
-        decimal = ET.SubElement(element, _qn("gco", "Decimal"))
+        element = ET.SubElement(bbox, tag)
+        decimal = ET.SubElement(element, GCO_DECIMAL)
         decimal.text = str(value)
 
     start = _format_date(main.get("temporal_date_from"))
     end = _format_date(main.get("temporal_date_to"))
     if start or end:
-        temporal_element = ET.SubElement(ex_extent, _qn("gmd", "temporalElement"))
-        temporal_extent = ET.SubElement(temporal_element, _qn("gmd", "EX_TemporalExtent"))
-        time_period = ET.SubElement(temporal_extent, _qn("gml", "TimePeriod"))
+        temporal_element = ET.SubElement(ex_extent, GMD_TEMPORAL_ELEMENT)
+        temporal_extent = ET.SubElement(temporal_element, GMD_EX_TEMPORAL_EXTENT)
+        time_period = ET.SubElement(temporal_extent, GML_TIME_PERIOD)
         if start:
-            begin = ET.SubElement(time_period, _qn("gml", "beginPosition"))
+            begin = ET.SubElement(time_period, GML_BEGIN_POSITION)
             begin.text = start
         if end:
-            end_position = ET.SubElement(time_period, _qn("gml", "endPosition"))
+            end_position = ET.SubElement(time_period, GML_END_POSITION)
             end_position.text = end
 
 
@@ -573,18 +746,16 @@ def _build_distribution(root: ET.Element, bundle: dict[str, Any]) -> None:
     """
     citation = bundle.get("citation") or {}
 
-    distribution_info = ET.SubElement(root, _qn("gmd", "distributionInfo"))
-    md_distribution = ET.SubElement(distribution_info, _qn("gmd", "MD_Distribution"))
-    distribution_format = ET.SubElement(md_distribution, _qn("gmd", "distributionFormat"))
-    md_format = ET.SubElement(distribution_format, _qn("gmd", "MD_Format"))
+    distribution_info = ET.SubElement(root, GMD_DISTRIBUTION_INFO)
+    md_distribution = ET.SubElement(distribution_info, GMD_MD_DISTRIBUTION)
+    distribution_format = ET.SubElement(md_distribution, GMD_DISTRIBUTION_FORMAT)
+    md_format = ET.SubElement(distribution_format, GMD_MD_FORMAT)
 
     format_name = citation.get("citation_data_form") or "Unknown"
-    name = ET.SubElement(md_format, _qn("gmd", "name"))
-    name.append(_character_string(format_name))
+    _text_child(md_format, GMD_NAME, format_name)
 
     if citation.get("citation_title"):
-        version = ET.SubElement(md_format, _qn("gmd", "version"))
-        version.append(_character_string(citation["citation_title"]))
+        _text_child(md_format, GMD_VERSION, citation["citation_title"])
 
 
 def _build_data_quality(root: ET.Element, bundle: dict[str, Any]) -> None:
@@ -600,58 +771,62 @@ def _build_data_quality(root: ET.Element, bundle: dict[str, Any]) -> None:
     group = bundle.get("group") or {}
     sources = bundle.get("sources", [])
     citation_lookup = bundle.get("citation_lookup", {})
+    source_citations = bundle.get("source_citations", {})
+    # Citations shared between sources are built once and copied thereafter.
+    built_citations: dict[Any, ET.Element] = {}
 
-    data_quality_info = ET.SubElement(root, _qn("gmd", "dataQualityInfo"))
-    data_quality = ET.SubElement(data_quality_info, _qn("gmd", "DQ_DataQuality"))
+    data_quality_info = ET.SubElement(root, GMD_DATA_QUALITY_INFO)
+    data_quality = ET.SubElement(data_quality_info, GMD_DQ_DATA_QUALITY)
 
-    scope = ET.SubElement(data_quality, _qn("gmd", "scope"))
-    dq_scope = ET.SubElement(scope, _qn("gmd", "DQ_Scope"))
-    level = ET.SubElement(dq_scope, _qn("gmd", "level"))
-    scope_code = ET.SubElement(level, _qn("gmd", "MD_ScopeCode"))
-    scope_code.set("codeList", "http://www.isotc211.org/2005/resources/codeList.xml#MD_ScopeCode")
-    scope_code.set("codeListValue", "dataset")
+    scope = ET.SubElement(data_quality, GMD_SCOPE)
+    dq_scope = ET.SubElement(scope, GMD_DQ_SCOPE)
+    level = ET.SubElement(dq_scope, GMD_LEVEL)
+    scope_code = ET.SubElement(level, GMD_MD_SCOPE_CODE, _DATASET_SCOPE_ATTRIBUTES)
     scope_code.text = "dataset"
 
-    report = ET.SubElement(data_quality, _qn("gmd", "report"))
-    domain_consistency = ET.SubElement(report, _qn("gmd", "DQ_DomainConsistency"))
-    result = ET.SubElement(domain_consistency, _qn("gmd", "result"))
-    conformance = ET.SubElement(result, _qn("gmd", "DQ_ConformanceResult"))
-    explanation = ET.SubElement(conformance, _qn("gmd", "explanation"))
+    report = ET.SubElement(data_quality, GMD_REPORT)
+    domain_consistency = ET.SubElement(report, GMD_DQ_DOMAIN_CONSISTENCY)
+    result = ET.SubElement(domain_consistency, GMD_RESULT)
+    conformance = ET.SubElement(result, GMD_DQ_CONFORMANCE_RESULT)
     accuracy = group.get("attribute_accuracy_report") or "No attribute accuracy report supplied."
-    explanation.append(_character_string(accuracy))
-    passed = ET.SubElement(conformance, _qn("gmd", "pass"))
-    passed_boolean = ET.SubElement(passed, _qn("gco", "Boolean"))
+    _text_child(conformance, GMD_EXPLANATION, accuracy)
+    passed = ET.SubElement(conformance, GMD_PASS)
+    passed_boolean = ET.SubElement(passed, GCO_BOOLEAN)
     passed_boolean.text = "true"
 
-    lineage = ET.SubElement(data_quality, _qn("gmd", "lineage"))
-    li_lineage = ET.SubElement(lineage, _qn("gmd", "LI_Lineage"))
+    lineage = ET.SubElement(data_quality, GMD_LINEAGE)
+    li_lineage = ET.SubElement(lineage, GMD_LI_LINEAGE)
 
     if sources:
         for source in sources:
-            source_element = ET.SubElement(li_lineage, _qn("gmd", "source"))
-            li_source = ET.SubElement(source_element, _qn("gmd", "LI_Source"))
+            source_element = ET.SubElement(li_lineage, GMD_SOURCE)
+            li_source = ET.SubElement(source_element, GMD_LI_SOURCE)
 
             if source.get("source_contribution"):
-                description = ET.SubElement(li_source, _qn("gmd", "description"))
-                description.append(_character_string(source["source_contribution"]))
+                _text_child(li_source, GMD_DESCRIPTION, source["source_contribution"])
 
             if source.get("source_name"):
-                source_scale = ET.SubElement(li_source, _qn("gmd", "sourceScale"))
-                md_extent = ET.SubElement(source_scale, _qn("gmd", "MD_RepresentativeFraction"))
-                denominator = ET.SubElement(md_extent, _qn("gmd", "denominator"))
-                denominator.append(_character_string(source.get("source_scale")))
+                source_scale = ET.SubElement(li_source, GMD_SOURCE_SCALE)
+                md_extent = ET.SubElement(source_scale, GMD_MD_REPRESENTATIVE_FRACTION)
+                _text_child(md_extent, GMD_DENOMINATOR, source.get("source_scale"))
 
             linked_citation_ids = []
             if source.get("citation_id"):
                 linked_citation_ids.append(source["citation_id"])
-            for row in bundle.get("source_citations", {}).get(source["source_id"], []):
+            for row in source_citations.get(source["source_id"], []):
                 linked_citation_ids.append(row["citation_id"])
 
             for citation_id in linked_citation_ids:
                 citation = citation_lookup.get(citation_id)
                 if citation:
-                    citation_element = ET.SubElement(li_source, _qn("gmd", "sourceCitation"))
-                    citation_element.append(_build_ci_citation(citation))
+                    citation_element = ET.SubElement(li_source, GMD_SOURCE_CITATION)
+                    ci_citation = built_citations.get(citation_id)
+                    if ci_citation is None:
+                        ci_citation = _build_ci_citation(citation)
+                        built_citations[citation_id] = ci_citation
+                    else:
+                        ci_citation = copy.deepcopy(ci_citation)
+                    citation_element.append(ci_citation)
 
 
 def _build_ci_citation(citation: dict[str, Any]) -> ET.Element:
@@ -663,26 +838,24 @@ def _build_ci_citation(citation: dict[str, Any]) -> ET.Element:
     Returns:
         Prepared Element representing the citation segment.
     """
-    ci_citation = ET.Element(_qn("gmd", "CI_Citation"))
-    title = ET.SubElement(ci_citation, _qn("gmd", "title"))
-    title.append(_character_string(citation.get("citation_title")))
+    ci_citation = ET.Element(GMD_CI_CITATION)
+    _text_child(ci_citation, GMD_TITLE, citation.get("citation_title"))
 
     if citation.get("citation_pubdate"):
-        date_element = ET.SubElement(ci_citation, _qn("gmd", "date"))
-        ci_date = ET.SubElement(date_element, _qn("gmd", "CI_Date"))
-        date_value = ET.SubElement(ci_date, _qn("gmd", "date"))
-        date_value.append(_character_string(_format_date(citation.get("citation_pubdate"))))
-        date_type = ET.SubElement(ci_date, _qn("gmd", "dateType"))
-        date_type_code = ET.SubElement(date_type, _qn("gmd", "CI_DateTypeCode"))
-        date_type_code.set("codeList", "http://www.isotc211.org/2005/resources/codeList.xml#CI_DateTypeCode")
-        date_type_code.set("codeListValue", "publication")
+        date_element = ET.SubElement(ci_citation, GMD_DATE)
+        ci_date = ET.SubElement(date_element, GMD_CI_DATE)
+        _text_child(ci_date, GMD_DATE, _format_date(citation.get("citation_pubdate")))
+        date_type = ET.SubElement(ci_date, GMD_DATE_TYPE)
+        date_type_code = ET.SubElement(
+            date_type, GMD_CI_DATE_TYPE_CODE, _PUBLICATION_DATE_TYPE_ATTRIBUTES
+        )
         date_type_code.text = "publication"
 
     if citation.get("online_linkage"):
-        linkage = ET.SubElement(ci_citation, _qn("gmd", "onlineResource"))
-        online_resource = ET.SubElement(linkage, _qn("gmd", "CI_OnlineResource"))
-        url = ET.SubElement(online_resource, _qn("gmd", "linkage"))
-        url_value = ET.SubElement(url, _qn("gmd", "URL"))
+        linkage = ET.SubElement(ci_citation, GMD_ONLINE_RESOURCE)
+        online_resource = ET.SubElement(linkage, GMD_CI_ONLINE_RESOURCE)
+        url = ET.SubElement(online_resource, GMD_LINKAGE)
+        url_value = ET.SubElement(url, GMD_URL)
         url_value.text = citation["online_linkage"]
     return ci_citation
 
@@ -701,18 +874,17 @@ def _build_extension_info(root: ET.Element, bundle: dict[str, Any]) -> None:
     if not attributes:
         return
 
-    metadata_extension = ET.SubElement(root, _qn("gmd", "metadataExtensionInfo"))
-    md_extension = ET.SubElement(metadata_extension, _qn("gmd", "MD_MetadataExtensionInformation"))
+    metadata_extension = ET.SubElement(root, GMD_METADATA_EXTENSION_INFO)
+    md_extension = ET.SubElement(metadata_extension, GMD_MD_METADATA_EXTENSION_INFORMATION)
     for attribute in attributes:
-        extended_element = ET.SubElement(md_extension, _qn("gmd", "extendedElementInformation"))
-        _optional_element(extended_element, "gmd", "name", attribute.get("attribute_name"))
-        _optional_element(extended_element, "gmd", "shortName", attribute.get("attribute_alias"))
-        _optional_element(extended_element, "gmd", "definition", attribute.get("attribute_definition"))
-        _optional_element(extended_element, "gmd", "condition", attribute.get("codeset_name"))
+        extended_element = ET.SubElement(md_extension, GMD_EXTENDED_ELEMENT_INFORMATION)
+        _optional_element(extended_element, GMD_NAME, attribute.get("attribute_name"))
+        _optional_element(extended_element, GMD_SHORT_NAME, attribute.get("attribute_alias"))
+        _optional_element(extended_element, GMD_DEFINITION, attribute.get("attribute_definition"))
+        _optional_element(extended_element, GMD_CONDITION, attribute.get("codeset_name"))
         data_type_value = attribute.get("attribute_type")
         if data_type_value:
-            data_type = ET.SubElement(extended_element, _qn("gmd", "dataType"))
-            data_type.append(_character_string(data_type_value))
+            _text_child(extended_element, GMD_DATA_TYPE, data_type_value)
 
         precision = attribute.get("attribute_precision")
         scale = attribute.get("attribute_scale")
@@ -726,5 +898,5 @@ def _build_extension_info(root: ET.Element, bundle: dict[str, Any]) -> None:
             detail_parts.append(f"scale={scale}")
         if detail_parts:
             detail_text = "; ".join(detail_parts)
-            _optional_element(extended_element, "gmd", "description", detail_text)
+            _optional_element(extended_element, GMD_DESCRIPTION, detail_text)
 
@@ -0,0 +1,283 @@
+"""
+Tests for the metadata cleanup database workflow.
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from metadata_exporter import cleanup, db
+from metadata_exporter.cleanup import CleanupTarget
+
+
+class FakeCursor:
+    """Record the statements and binds a cleanup step sends to Oracle."""
+
+    def __init__(self, rows: list[tuple[Any, ...]] | None = None) -> None:
+        self.rows = rows or []
+        self.executed: list[tuple[str | None, Any]] = []
+        self.rowcount = 0
+        self.prepared: str | None = None
+        self.batches: list[list[dict[str, Any]]] = []
+        self.batch_errors: list[Any] = []
+
+    def execute(self, sql: str | None, params: Any = None, **binds: Any) -> None:
+        self.executed.append((sql, params if params is not None else binds))
+
+    def prepare(self, sql: str) -> None:
+        self.prepared = sql
+
+    def executemany(self, sql: str | None, params: list[Any], **options: Any) -> None:
+        assert sql is None and self.prepared is not None
+        assert options == {"batcherrors": True, "arraydmlrowcounts": True}
+        self.batches.append(list(params))
+
+    def getbatcherrors(self) -> list[Any]:
+        return self.batch_errors
+
+    def getarraydmlrowcounts(self) -> list[int]:
+        return [1] * len(self.batches[-1])
+
+    def fetchone(self) -> tuple[Any, ...] | None:
+        return self.rows[0] if self.rows else None
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class FakeConnection:
+    """Serve cursors from a database with the given character set."""
+
+    def __init__(self, character_set: str) -> None:
+        self.character_set = character_set
+        self.cursors: list[FakeCursor] = []
+        self.commits = 0
+        self.rolled_back = False
+
+    def __enter__(self) -> "FakeConnection":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def cursor(self) -> FakeCursor:
+        cursor = FakeCursor([(self.character_set,)] if not self.cursors else [])
+        cursor.connection = self
+        self.cursors.append(cursor)
+        return cursor
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rolled_back = True
+
+
+def test_server_side_update_translates_candidate_rows() -> None:
+    target = CleanupTarget(table="ADMIN.METADATA_MAIN", column="ABSTRACT")
+    update_cursor = FakeCursor()
+    update_cursor.rowcount = 3
+
+    updated = cleanup._apply_server_side(
+        FakeCursor(), update_cursor, target, dry_run=False
+    )
+
+    assert updated == 3
+    [(sql, binds)] = update_cursor.executed
+    assert sql == (
+        "UPDATE ADMIN.METADATA_MAIN SET ABSTRACT = "
+        "TRANSLATE(ABSTRACT, :source, :target) "
+        "WHERE REGEXP_LIKE(ABSTRACT, :pattern)"
+    )
+    assert binds == {
+        "source": cleanup._TRANSLATE_SOURCE,
+        "target": cleanup._TRANSLATE_TARGET,
+        "pattern": cleanup._CANDIDATE_PATTERN,
+    }
+
+
+def test_parallel_server_side_update_keeps_table_qualified_predicates() -> None:
+    target = CleanupTarget(
+        table="METADATA_MAIN",
+        column="ABSTRACT",
+        where="METADATA_MAIN.STATUS = 'x'",
+    )
+    update_cursor = FakeCursor()
+
+    cleanup._apply_server_side(
+        FakeCursor(), update_cursor, target, dry_run=False, parallel=True
+    )
+
+    [(sql, _)] = update_cursor.executed
+    assert sql.startswith(
+        f"UPDATE /*+ PARALLEL({cleanup._PARALLEL_DEGREE}) */ METADATA_MAIN SET "
+    )
+    assert sql.endswith("AND (METADATA_MAIN.STATUS = 'x')")
+
+
+def test_server_side_dry_run_only_selects() -> None:
+    target = CleanupTarget(table="ADMIN.METADATA_MAIN", column="ABSTRACT")
+    select_cursor = FakeCursor([("AAA", "\u2018Soil\u2019", "'Soil'")])
+    update_cursor = FakeCursor()
+
+    updated = cleanup._apply_server_side(
+        select_cursor, update_cursor, target, dry_run=True
+    )
+
+    assert updated == 0
+    assert update_cursor.executed == []
+    [(sql, _)] = select_cursor.executed
+    assert sql.startswith("SELECT ROWID, ABSTRACT, TRANSLATE(ABSTRACT")
+
+
+class FakePool:
+    """Hand out a fresh fake connection for every acquire."""
+
+    def __init__(self) -> None:
+        self.connections: list[FakeConnection] = []
+        self.closed = False
+
+    def acquire(self) -> FakeConnection:
+        connection = FakeConnection("AL32UTF8")
+        self.connections.append(connection)
+        return connection
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _write_targets(tmp_path: Path, *targets: tuple[str, str]) -> Path:
+    config_path = tmp_path / "targets.json"
+    config_path.write_text(
+        json.dumps([{"table": table, "column": column} for table, column in targets]),
+        encoding="utf-8",
+    )
+    return config_path
+
+
+def _run_server_side(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, connection: FakeConnection
+) -> int:
+    config_path = _write_targets(tmp_path, ("ADMIN.METADATA_MAIN", "ABSTRACT"))
+    monkeypatch.setattr(db, "create_connection", lambda: connection)
+    args = cleanup.parse_arguments(
+        ["--config", str(config_path), "--env-file", "", "--server-side", "--commit"]
+    )
+    return cleanup.run_cleanup(args)
+
+
+def test_server_side_refuses_non_unicode_database(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    connection = FakeConnection("WE8MSWIN1252")
+
+    with pytest.raises(RuntimeError, match="found WE8MSWIN1252"):
+        _run_server_side(tmp_path, monkeypatch, connection)
+    assert len(connection.cursors) == 1
+    assert connection.commits == 0
+
+
+def test_server_side_runs_on_unicode_database(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    connection = FakeConnection("AL32UTF8")
+
+    _run_server_side(tmp_path, monkeypatch, connection)
+
+    [(sql, _)] = connection.cursors[-1].executed
+    assert sql.startswith("UPDATE ADMIN.METADATA_MAIN SET ABSTRACT")
+    assert connection.commits == 1
+
+
+def _curly_rows(count: int) -> list[tuple[Any, ...]]:
+    return [
+        (f"ROW{index}", f"\u2018Soil {index}\u2019", None) for index in range(count)
+    ]
+
+
+def test_client_side_updates_are_sent_in_batches() -> None:
+    target = CleanupTarget(table="ADMIN.METADATA_MAIN", column="ABSTRACT")
+    update_cursor = FakeCursor()
+
+    updated = cleanup._apply_updates(
+        FakeCursor(_curly_rows(2500)), update_cursor, target, dry_run=False
+    )
+
+    assert updated == 2500
+    assert update_cursor.prepared == target.update_sql
+    assert [len(batch) for batch in update_cursor.batches] == [1000, 1000, 500]
+    assert update_cursor.batches[2][-1] == {"value": "'Soil 2499'", "rowid": "ROW2499"}
+
+
+def test_client_side_batch_errors_raise() -> None:
+    target = CleanupTarget(table="ADMIN.METADATA_MAIN", column="ABSTRACT")
+    update_cursor = FakeCursor()
+    update_cursor.batch_errors = [SimpleNamespace(offset=1, message="ORA-01401")]
+
+    with pytest.raises(RuntimeError, match="1 update\\(s\\) failed within a batch"):
+        cleanup._apply_updates(
+            FakeCursor(_curly_rows(3)), update_cursor, target, dry_run=False
+        )
+
+
+def test_client_side_dry_run_issues_no_update() -> None:
+    target = CleanupTarget(table="ADMIN.METADATA_MAIN", column="ABSTRACT")
+    update_cursor = FakeCursor()
+
+    updated = cleanup._apply_updates(
+        FakeCursor(_curly_rows(1500)), update_cursor, target, dry_run=True
+    )
+
+    assert updated == 0
+    assert update_cursor.prepared is None
+    assert update_cursor.batches == []
+
+
+def test_pooled_cleanup_runs_each_table_on_one_connection(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = _write_targets(
+        tmp_path,
+        ("ADMIN.METADATA_MAIN", "TITLE"),
+        ("ADMIN.METADATA_GROUPS", "PURPOSE"),
+        ("ADMIN.METADATA_MAIN", "ABSTRACT"),
+    )
+    pool = FakePool()
+    monkeypatch.setattr(db, "create_pool", lambda max_size: pool)
+    updates = {"TITLE": 2, "PURPOSE": 3, "ABSTRACT": 4}
+    processed: list[tuple[FakeConnection, str]] = []
+
+    def apply_target(
+        select_cursor: FakeCursor,
+        update_cursor: FakeCursor,
+        target: CleanupTarget,
+        dry_run: bool,
+    ) -> int:
+        processed.append((select_cursor.connection, target.column))
+        return updates[target.column]
+
+    monkeypatch.setattr(cleanup, "_apply_updates", apply_target)
+    args = cleanup.parse_arguments(
+        ["--config", str(config_path), "--env-file", "", "--workers", "3", "--commit"]
+    )
+
+    assert cleanup.run_cleanup(args) == 9
+    columns_by_connection: dict[int, list[str]] = {}
+    for connection, column in processed:
+        columns_by_connection.setdefault(id(connection), []).append(column)
+    # Workers may acquire in either order; each table keeps one connection.
+    assert sorted(columns_by_connection.values()) == [
+        ["PURPOSE"],
+        ["TITLE", "ABSTRACT"],
+    ]
+    assert sorted(connection.commits for connection in pool.connections) == [1, 2]
+    assert pool.closed
@@ -0,0 +1,76 @@
+"""
+Tests for the metadata export configuration loader.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from metadata_exporter import config_loader
+from metadata_exporter.config_loader import MetadataExportConfig, load_configurations
+
+
+def _write_csv(tmp_path: Path, content: str) -> Path:
+    path = tmp_path / "metadata_ids.csv"
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_load_configurations_parses_flags_and_defaults(tmp_path: Path) -> None:
+    path = _write_csv(
+        tmp_path,
+        "metadata_id,include_sources,include_keywords\n"
+        "# commented out\n"
+        "HORIZONS,false,yes\n"
+        "NATMAP5000,,\n",
+    )
+    assert load_configurations(path) == [
+        MetadataExportConfig("HORIZONS", include_sources=False, include_keywords=True),
+        MetadataExportConfig("NATMAP5000", include_sources=True, include_keywords=True),
+    ]
+
+
+def test_load_configurations_allows_missing_optional_columns(tmp_path: Path) -> None:
+    path = _write_csv(tmp_path, "metadata_id\nHORIZONS\n\nNATMAP5000\n")
+    configs = load_configurations(path)
+    assert [config.metadata_id for config in configs] == ["HORIZONS", "NATMAP5000"]
+
+
+def test_load_configurations_rejects_blank_metadata_id(tmp_path: Path) -> None:
+    path = _write_csv(tmp_path, "metadata_id,include_sources\n ,true\n")
+    with pytest.raises(ValueError, match="missing mandatory 'metadata_id'"):
+        load_configurations(path)
+
+
+def test_iter_configurations_streams_valid_rows_in_order(tmp_path: Path) -> None:
+    path = _write_csv(tmp_path, "metadata_id\nHORIZONS\nNATMAP5000\n")
+    configs = config_loader.iter_configurations(path)
+    assert next(configs) == MetadataExportConfig("HORIZONS")
+    assert list(configs) == [MetadataExportConfig("NATMAP5000")]
+
+
+def test_iter_configurations_validates_whole_file_up_front(tmp_path: Path) -> None:
+    path = _write_csv(tmp_path, "metadata_id\nHORIZONS\n ,\n")
+    with pytest.raises(ValueError, match="Row 3 missing mandatory"):
+        config_loader.iter_configurations(path)
+
+
+def test_iter_configurations_reports_missing_file_immediately(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        config_loader.iter_configurations(tmp_path / "absent.csv")
+
+
+def test_load_configurations_parses_the_file_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = _write_csv(tmp_path, "metadata_id\nHORIZONS\n")
+    parse = config_loader._iter_csv_configurations
+    parsed: list[Path] = []
+
+    def counting_parse(csv_path: Path):
+        parsed.append(csv_path)
+        return parse(csv_path)
+
+    monkeypatch.setattr(config_loader, "_iter_csv_configurations", counting_parse)
+    assert load_configurations(path) == [MetadataExportConfig("HORIZONS")]
+    assert parsed == [path]
@@ -0,0 +1,317 @@
+"""
+Tests for the batched metadata bundle queries.
+"""
+
+from typing import Any
+
+import pytest
+
+from metadata_exporter import db
+from metadata_exporter.config_loader import MetadataExportConfig
+
+# Result columns per query, in the order the statements select them.
+QUERY_COLUMNS: dict[str, tuple[str, ...]] = {
+    "main": (
+        "M_METADATA_ID",
+        "M_TITLE",
+        "G_GROUP_ID",
+        "C_CITATION_ID",
+        "C_CITATION_TITLE",
+        "GC_CONTACT_ID",
+        "MC_CONTACT_ID",
+        "HAS_ATTRIBUTES",
+        "HAS_KEYWORDS",
+        "HAS_SOURCES",
+    ),
+    "attributes": ("METADATA_ID", "ATTRIBUTE_NAME", "ATTRIBUTE_NO"),
+    "keywords": ("METADATA_ID", "KEYWORD_TYPE", "KEYWORD"),
+    "sources": ("ID", "METADATA_ID", "SOURCE_ID", "CITATION_ID"),
+    "source_citations": ("SOURCE_ID", "CITATION_ID"),
+    "citations": ("CITATION_ID", "CITATION_TITLE"),
+}
+
+# Column holding the identifier each query filters on.
+FILTER_COLUMNS = {
+    "main": "M_METADATA_ID",
+    "attributes": "METADATA_ID",
+    "keywords": "METADATA_ID",
+    "sources": "METADATA_ID",
+    "source_citations": "SOURCE_ID",
+    "citations": "CITATION_ID",
+}
+
+
+def _query_kind(sql: str) -> str:
+    if "AS M_METADATA_ID" in sql:
+        return "main"
+    if "METADATA_SOURCE_CITATION" in sql:
+        return "source_citations"
+    for kind, table in (
+        ("citations", "METADATA_CITATIONS"),
+        ("attributes", "METADATA_ATTRIBUTES"),
+        ("keywords", "METADATA_KEYWORDS"),
+        ("sources", "METADATA_MAIN_SOURCE"),
+    ):
+        if f"FROM ADMIN.{table}" in sql:
+            return kind
+    raise AssertionError(f"Unexpected statement: {sql}")
+
+
+class FakeIdListType:
+    def newobject(self, values: list[str]) -> list[str]:
+        return list(values)
+
+
+class FakeCursor:
+    """Answer the batch queries from in-memory rows keyed by query kind."""
+
+    def __init__(self, connection: "FakeConnection") -> None:
+        self.connection = connection
+        self.rowfactory: Any = None
+        self.description: list[tuple[str]] = []
+        self._sql = ""
+        self._rows: list[tuple[Any, ...]] = []
+
+    def __enter__(self) -> "FakeCursor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def prepare(self, sql: str) -> None:
+        self._sql = sql
+
+    def execute(self, sql: str | None, ids: list[str]) -> None:
+        kind = _query_kind(sql or self._sql)
+        self.connection.executed.append((kind, ids))
+        columns = QUERY_COLUMNS[kind]
+        self.description = [(column,) for column in columns]
+        wanted = set(ids)
+        self._rows = [
+            tuple(row.get(column) for column in columns)
+            for row in self.connection.tables.get(kind, [])
+            if str(row[FILTER_COLUMNS[kind]]) in wanted
+        ]
+
+    def fetchall(self) -> list[Any]:
+        return [self.rowfactory(*row) for row in self._rows]
+
+
+class FakeConnection:
+    def __init__(self, **tables: list[dict[str, Any]]) -> None:
+        self.tables = tables
+        self.executed: list[tuple[str, list[str]]] = []
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def gettype(self, name: str) -> FakeIdListType:
+        assert name == "SYS.ODCIVARCHAR2LIST"
+        return FakeIdListType()
+
+    def queried(self) -> list[str]:
+        return [kind for kind, _ in self.executed]
+
+
+def _main_row(metadata_id: str, **columns: Any) -> dict[str, Any]:
+    row = {
+        "M_METADATA_ID": metadata_id,
+        "HAS_ATTRIBUTES": 0,
+        "HAS_KEYWORDS": 0,
+        "HAS_SOURCES": 0,
+    }
+    row.update(columns)
+    return row
+
+
+@pytest.fixture(autouse=True)
+def fake_driver(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The LOB output handler is never invoked by the fake cursor.
+    monkeypatch.setattr(db, "_oracledb", object())
+
+
+def test_bundles_group_child_rows_by_metadata_id() -> None:
+    connection = FakeConnection(
+        main=[
+            _main_row("HORIZONS", HAS_ATTRIBUTES=1, HAS_KEYWORDS=1),
+            _main_row("NATMAP5000", HAS_ATTRIBUTES=1, HAS_KEYWORDS=1),
+        ],
+        attributes=[
+            {"METADATA_ID": "NATMAP5000", "ATTRIBUTE_NAME": "MAP_UNIT"},
+            {"METADATA_ID": "HORIZONS", "ATTRIBUTE_NAME": "DEPTH"},
+        ],
+        keywords=[
+            {"METADATA_ID": "HORIZONS", "KEYWORD_TYPE": "theme", "KEYWORD": "soil"},
+            {"METADATA_ID": "NATMAP5000", "KEYWORD_TYPE": "place", "KEYWORD": "UK"},
+        ],
+    )
+
+    bundles = db.fetch_metadata_bundles(
+        connection,
+        [MetadataExportConfig("NATMAP5000"), MetadataExportConfig("HORIZONS")],
+    )
+
+    assert [bundle["metadata_id"] for bundle in bundles] == ["NATMAP5000", "HORIZONS"]
+    assert [row["attribute_name"] for row in bundles[0]["attributes"]] == ["MAP_UNIT"]
+    assert [row["attribute_name"] for row in bundles[1]["attributes"]] == ["DEPTH"]
+    assert [row["keyword"] for row in bundles[0]["keywords"]] == ["UK"]
+    assert [row["keyword"] for row in bundles[1]["keywords"]] == ["soil"]
+
+
+def test_bundles_order_child_rows_with_nulls_last() -> None:
+    connection = FakeConnection(
+        main=[_main_row("HORIZONS", HAS_ATTRIBUTES=1, HAS_SOURCES=1)],
+        attributes=[
+            {"METADATA_ID": "HORIZONS", "ATTRIBUTE_NAME": "C", "ATTRIBUTE_NO": None},
+            {"METADATA_ID": "HORIZONS", "ATTRIBUTE_NAME": "B", "ATTRIBUTE_NO": 2},
+            {"METADATA_ID": "HORIZONS", "ATTRIBUTE_NAME": None, "ATTRIBUTE_NO": 1},
+            {"METADATA_ID": "HORIZONS", "ATTRIBUTE_NAME": "A", "ATTRIBUTE_NO": 1},
+        ],
+        sources=[
+            {"ID": 3, "METADATA_ID": "HORIZONS", "SOURCE_ID": 30},
+            {"ID": 1, "METADATA_ID": "HORIZONS", "SOURCE_ID": 10},
+            {"ID": 2, "METADATA_ID": "HORIZONS", "SOURCE_ID": 20},
+        ],
+    )
+
+    [bundle] = db.fetch_metadata_bundles(connection, [MetadataExportConfig("HORIZONS")])
+
+    assert [
+        (row["attribute_no"], row["attribute_name"]) for row in bundle["attributes"]
+    ] == [(1, "A"), (1, None), (2, "B"), (None, "C")]
+    assert [row["id"] for row in bundle["sources"]] == [1, 2, 3]
+
+
+def test_bundles_skip_child_queries_for_records_without_rows() -> None:
+    connection = FakeConnection(main=[_main_row("HORIZONS")])
+
+    [bundle] = db.fetch_metadata_bundles(connection, [MetadataExportConfig("HORIZONS")])
+
+    assert connection.queried() == ["main"]
+    assert bundle["attributes"] == []
+    assert bundle["keywords"] == []
+    assert bundle["sources"] == []
+
+
+def test_bundles_only_query_children_for_flagged_records() -> None:
+    connection = FakeConnection(
+        main=[
+            _main_row("HORIZONS", HAS_KEYWORDS=1),
+            _main_row("NATMAP5000", HAS_KEYWORDS=1),
+            _main_row("SOILSCAPES"),
+        ],
+    )
+
+    db.fetch_metadata_bundles(
+        connection,
+        [
+            MetadataExportConfig("HORIZONS"),
+            MetadataExportConfig("NATMAP5000", include_keywords=False),
+            MetadataExportConfig("SOILSCAPES"),
+        ],
+    )
+
+    assert connection.executed[1:] == [("keywords", ["HORIZONS"])]
+
+
+def test_bundles_reuse_cached_citations_across_batches() -> None:
+    connection = FakeConnection(
+        main=[
+            _main_row(
+                "HORIZONS", C_CITATION_ID=5, C_CITATION_TITLE="Main", HAS_SOURCES=1
+            ),
+            _main_row("NATMAP5000", HAS_SOURCES=1),
+        ],
+        sources=[
+            {"ID": 1, "METADATA_ID": "HORIZONS", "SOURCE_ID": 10, "CITATION_ID": 5},
+            {"ID": 2, "METADATA_ID": "NATMAP5000", "SOURCE_ID": 20, "CITATION_ID": 7},
+        ],
+        source_citations=[{"SOURCE_ID": 20, "CITATION_ID": 8}],
+        citations=[
+            {"CITATION_ID": 7, "CITATION_TITLE": "Survey"},
+            {"CITATION_ID": 8, "CITATION_TITLE": "Memoir"},
+        ],
+    )
+    citation_cache: dict[Any, dict[str, Any]] = {}
+
+    [first] = db.fetch_metadata_bundles(
+        connection, [MetadataExportConfig("HORIZONS")], citation_cache
+    )
+    [second] = db.fetch_metadata_bundles(
+        connection, [MetadataExportConfig("NATMAP5000")], citation_cache
+    )
+    connection.executed.clear()
+    [third] = db.fetch_metadata_bundles(
+        connection, [MetadataExportConfig("NATMAP5000")], citation_cache
+    )
+
+    # The main citation seeds the cache, so the first batch needs no lookup.
+    assert first["citation_lookup"][5]["citation_title"] == "Main"
+    assert sorted(second["citation_lookup"]) == [7, 8]
+    assert sorted(citation_cache) == [5, 7, 8]
+    assert "citations" not in connection.queried()
+    assert third["citation_lookup"] == second["citation_lookup"]
+
+
+def test_bundles_scope_source_citations_to_each_record() -> None:
+    connection = FakeConnection(
+        main=[
+            _main_row("HORIZONS", HAS_SOURCES=1),
+            _main_row("NATMAP5000", HAS_SOURCES=1),
+        ],
+        sources=[
+            {"ID": 1, "METADATA_ID": "HORIZONS", "SOURCE_ID": 10, "CITATION_ID": 5},
+            {"ID": 2, "METADATA_ID": "NATMAP5000", "SOURCE_ID": 20},
+        ],
+        source_citations=[
+            {"SOURCE_ID": 10, "CITATION_ID": 6},
+            {"SOURCE_ID": 20, "CITATION_ID": 7},
+        ],
+        citations=[
+            {"CITATION_ID": 5, "CITATION_TITLE": "Survey"},
+            {"CITATION_ID": 6, "CITATION_TITLE": "Memoir"},
+            {"CITATION_ID": 7, "CITATION_TITLE": "Bulletin"},
+        ],
+    )
+
+    horizons, natmap = db.fetch_metadata_bundles(
+        connection,
+        [MetadataExportConfig("HORIZONS"), MetadataExportConfig("NATMAP5000")],
+    )
+
+    assert list(horizons["source_citations"]) == [10]
+    assert sorted(horizons["citation_lookup"]) == [5, 6]
+    assert list(natmap["source_citations"]) == [20]
+    assert sorted(natmap["citation_lookup"]) == [7]
+
+
+def test_missing_metadata_id_leaves_a_gap_in_the_batch() -> None:
+    connection = FakeConnection(
+        main=[_main_row("HORIZONS", HAS_KEYWORDS=1), _main_row("NATMAP5000")],
+        keywords=[
+            {"METADATA_ID": "HORIZONS", "KEYWORD_TYPE": "theme", "KEYWORD": "soil"},
+        ],
+    )
+
+    bundles = db.fetch_metadata_bundles(
+        connection,
+        [
+            MetadataExportConfig("HORIZONS"),
+            MetadataExportConfig("ABSENT"),
+            MetadataExportConfig("NATMAP5000"),
+        ],
+    )
+
+    assert [bundle and bundle["metadata_id"] for bundle in bundles] == [
+        "HORIZONS",
+        None,
+        "NATMAP5000",
+    ]
+    assert connection.executed[1:] == [("keywords", ["HORIZONS"])]
+
+
+def test_single_bundle_raises_for_missing_metadata_id() -> None:
+    connection = FakeConnection(main=[])
+
+    with pytest.raises(LookupError, match="'ABSENT' not found in METADATA_MAIN"):
+        db.fetch_metadata_bundle(connection, "ABSENT")
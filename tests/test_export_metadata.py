@@ -0,0 +1,272 @@
+"""
+Tests for the metadata export command-line workflow.
+"""
+
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from metadata_exporter import db, export_metadata, xml_builder
+from metadata_exporter.config_loader import MetadataExportConfig
+
+
+class FakeConnection:
+    def __enter__(self) -> "FakeConnection":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+class FakePool:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def acquire(self) -> FakeConnection:
+        return FakeConnection()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _write_config(tmp_path: Path, *metadata_ids: str) -> Path:
+    config_path = tmp_path / "metadata_ids.csv"
+    config_path.write_text(
+        "metadata_id\n" + "".join(f"{value}\n" for value in metadata_ids),
+        encoding="utf-8",
+    )
+    return config_path
+
+
+def _fetch_known(*known_ids: str) -> Any:
+    def fetch(
+        connection: Any, batch: Any, citation_cache: Any = None
+    ) -> list[dict[str, Any] | None]:
+        return [
+            {"metadata_id": config.metadata_id}
+            if config.metadata_id in known_ids
+            else None
+            for config in batch
+        ]
+
+    return fetch
+
+
+@pytest.fixture
+def pool(monkeypatch: pytest.MonkeyPatch) -> FakePool:
+    fake_pool = FakePool()
+    monkeypatch.setattr(db, "create_pool", lambda max_size: fake_pool)
+    # Two records per batch, so a short configuration spans several batches.
+    monkeypatch.setattr(export_metadata, "_EXPORT_BATCH_SIZE", 4)
+    return fake_pool
+
+
+@pytest.fixture
+def simple_trees(monkeypatch: pytest.MonkeyPatch) -> None:
+    def build(bundle: dict[str, Any], options: Any = None) -> ET.ElementTree:
+        return ET.ElementTree(ET.Element("record", id=bundle["metadata_id"]))
+
+    monkeypatch.setattr(xml_builder, "build_metadata_tree", build)
+
+
+def test_export_rejects_invalid_configuration_before_writing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_path = tmp_path / "metadata_ids.csv"
+    rows = "".join(f"ID{index}\n" for index in range(2500))
+    config_path.write_text(f"metadata_id\n{rows} \n", encoding="utf-8")
+    output_directory = tmp_path / "output"
+
+    def unexpected_connection() -> None:
+        raise AssertionError("no connection should be opened")
+
+    monkeypatch.setattr(db, "create_connection", unexpected_connection)
+
+    with pytest.raises(ValueError, match="Row 2502 missing mandatory"):
+        export_metadata.export_metadata_records(config_path, output_directory)
+    assert not output_directory.exists()
+
+
+def test_export_writes_records_before_a_missing_metadata_id(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, simple_trees: None
+) -> None:
+    config_path = _write_config(tmp_path, "HORIZONS", "ABSENT", "NATMAP5000")
+    output_directory = tmp_path / "output"
+    monkeypatch.setattr(db, "create_connection", FakeConnection)
+    monkeypatch.setattr(
+        db, "fetch_metadata_bundles", _fetch_known("HORIZONS", "NATMAP5000")
+    )
+
+    with pytest.raises(LookupError, match="'ABSENT' not found in METADATA_MAIN"):
+        export_metadata.export_metadata_records(config_path, output_directory)
+    assert sorted(path.name for path in output_directory.iterdir()) == [
+        "HORIZONS.xml"
+    ]
+
+
+def test_pooled_export_writes_batches_in_input_order(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    pool: FakePool,
+    simple_trees: None,
+) -> None:
+    metadata_ids = [f"ID{index}" for index in range(6)]
+    config_path = _write_config(tmp_path, *metadata_ids)
+    second_batch_fetched = threading.Event()
+    fetch_known = _fetch_known(*metadata_ids)
+
+    def fetch(connection: Any, batch: Any, citation_cache: Any = None) -> Any:
+        # The first batch only completes after the second, out of input order.
+        if batch[0].metadata_id == "ID0":
+            assert second_batch_fetched.wait(timeout=5)
+        if batch[0].metadata_id == "ID2":
+            second_batch_fetched.set()
+        return fetch_known(connection, batch, citation_cache)
+
+    monkeypatch.setattr(db, "fetch_metadata_bundles", fetch)
+
+    written = export_metadata.export_metadata_records(
+        config_path, tmp_path / "output", workers=2
+    )
+
+    assert [path.stem for path in written] == metadata_ids
+    assert pool.closed
+
+
+def test_pooled_export_raises_worker_errors(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    pool: FakePool,
+    simple_trees: None,
+) -> None:
+    config_path = _write_config(tmp_path, "HORIZONS", "NATMAP5000", "BROKEN")
+
+    def fetch(connection: Any, batch: Any, citation_cache: Any = None) -> Any:
+        if any(config.metadata_id == "BROKEN" for config in batch):
+            raise RuntimeError("ORA-03113: end-of-file on communication channel")
+        return _fetch_known("HORIZONS", "NATMAP5000")(connection, batch)
+
+    monkeypatch.setattr(db, "fetch_metadata_bundles", fetch)
+
+    with pytest.raises(RuntimeError, match="ORA-03113"):
+        export_metadata.export_metadata_records(
+            config_path, tmp_path / "output", workers=2
+        )
+    assert pool.closed
+
+
+def test_pooled_export_shares_one_citation_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    pool: FakePool,
+    simple_trees: None,
+) -> None:
+    metadata_ids = [f"ID{index}" for index in range(6)]
+    config_path = _write_config(tmp_path, *metadata_ids)
+    caches: list[dict[str, Any]] = []
+    fetched_citations: list[str] = []
+    lock = threading.Lock()
+
+    def fetch(connection: Any, batch: Any, citation_cache: Any = None) -> Any:
+        # Every record cites the same survey, as most LandIS records do.
+        with lock:
+            caches.append(citation_cache)
+            if "SURVEY" not in citation_cache:
+                fetched_citations.append("SURVEY")
+                citation_cache["SURVEY"] = {"citation_title": "Soil Survey"}
+        return _fetch_known(*metadata_ids)(connection, batch)
+
+    monkeypatch.setattr(db, "fetch_metadata_bundles", fetch)
+
+    export_metadata.export_metadata_records(
+        config_path, tmp_path / "output", workers=2
+    )
+
+    assert len(caches) == 3
+    assert all(cache is caches[0] for cache in caches)
+    assert fetched_citations == ["SURVEY"]
+
+
+def _batches(*batches: list[str]) -> list[list[MetadataExportConfig]]:
+    return [[MetadataExportConfig(value) for value in batch] for batch in batches]
+
+
+def test_export_batches_prefetch_the_next_batch_and_keep_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    batches = _batches(["HORIZONS", "NATMAP5000"], ["SOILSCAPES"], ["LANDIS"])
+    fetch_known = _fetch_known("HORIZONS", "NATMAP5000", "SOILSCAPES", "LANDIS")
+    second_fetch_started = threading.Event()
+    prefetched_while_building: list[bool] = []
+
+    def fetch(batch: Any) -> Any:
+        if batch[0].metadata_id == "SOILSCAPES":
+            second_fetch_started.set()
+        return fetch_known(None, batch)
+
+    def build(bundle: dict[str, Any], options: Any = None) -> ET.ElementTree:
+        if bundle["metadata_id"] == "HORIZONS":
+            prefetched_while_building.append(second_fetch_started.wait(timeout=5))
+        return ET.ElementTree(ET.Element("record", id=bundle["metadata_id"]))
+
+    monkeypatch.setattr(xml_builder, "build_metadata_tree", build)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        written = export_metadata._export_batches(
+            executor, fetch, batches, 1, tmp_path, False, xml_builder.BuildOptions()
+        )
+
+    assert [path.stem for path in written] == [
+        "HORIZONS",
+        "NATMAP5000",
+        "SOILSCAPES",
+        "LANDIS",
+    ]
+    # The second batch is fetched while the first one is still being built.
+    assert prefetched_while_building == [True]
+
+
+def test_export_batches_raise_a_prefetched_fetch_error_after_earlier_writes(
+    tmp_path: Path, simple_trees: None
+) -> None:
+    batches = _batches(["HORIZONS"], ["BROKEN"], ["NATMAP5000"])
+
+    def fetch(batch: Any) -> Any:
+        if batch[0].metadata_id == "BROKEN":
+            raise RuntimeError("ORA-03113: end-of-file on communication channel")
+        return _fetch_known("HORIZONS", "NATMAP5000")(None, batch)
+
+    with ThreadPoolExecutor(max_workers=1) as executor, pytest.raises(
+        RuntimeError, match="ORA-03113"
+    ):
+        export_metadata._export_batches(
+            executor, fetch, batches, 1, tmp_path, False, xml_builder.BuildOptions()
+        )
+
+    assert [path.name for path in tmp_path.iterdir()] == ["HORIZONS.xml"]
+
+
+def test_export_raises_when_the_writer_thread_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, simple_trees: None
+) -> None:
+    config_path = _write_config(tmp_path, "HORIZONS", "NATMAP5000")
+    monkeypatch.setattr(db, "create_connection", FakeConnection)
+    monkeypatch.setattr(
+        db, "fetch_metadata_bundles", _fetch_known("HORIZONS", "NATMAP5000")
+    )
+    writer_threads: list[threading.Thread] = []
+
+    def failing_write(tree: ET.ElementTree, output_path: Path) -> Path:
+        writer_threads.append(threading.current_thread())
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(export_metadata, "_write_tree", failing_write)
+
+    with pytest.raises(OSError, match="No space left on device"):
+        export_metadata.export_metadata_records(config_path, tmp_path / "output")
+    assert writer_threads
+    assert threading.main_thread() not in writer_threads
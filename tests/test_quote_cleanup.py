@@ -18,7 +18,7 @@ def test_normalise_quotes_replaces_curly_double_marks() -> None:
 
 
 def test_normalise_quotes_replaces_inverted_question_mark() -> None:
-    text = "¿Hello?"
+    text = "\u00bfHello?"
     expected = "'Hello?"
     assert normalise_quotes(text) == expected
 
@@ -27,3 +27,13 @@ def test_normalise_quotes_returns_original_when_no_changes() -> None:
     text = 'Plain ASCII text with "double" and \'single\' quotes.'
     assert normalise_quotes(text) == text
 
+
+def test_normalise_quotes_returns_same_object_when_nothing_to_replace() -> None:
+    text = "Soil survey of England and Wales \u00e9t\u00e9"
+    assert normalise_quotes(text) is text
+
+
+def test_normalise_quotes_replaces_ascii_backtick() -> None:
+    text = "The `Soilscapes` dataset."
+    expected = "The 'Soilscapes' dataset."
+    assert normalise_quotes(text) == expected
@@ -0,0 +1,57 @@
+"""
+Tests for the ISO 19139 metadata tree builder.
+"""
+
+from datetime import date, datetime
+import xml.etree.ElementTree as ET
+
+from metadata_exporter.xml_builder import (
+    GCO_CHARACTER_STRING,
+    GMD_CI_CITATION,
+    GMD_CI_DATE,
+    GMD_DATE,
+    GMD_SOURCE_CITATION,
+    GML_BEGIN_POSITION,
+    GML_END_POSITION,
+    build_metadata_tree,
+)
+
+
+def _bundle(**main: object) -> dict:
+    return {
+        "metadata_id": "NATMAP1000",
+        "main": {"title": "NATMAP 1000", "abstract": "Soil map.", **main},
+    }
+
+
+def test_build_metadata_tree_formats_temporal_datetimes_as_dates() -> None:
+    bundle = _bundle(
+        west_bounding_coordinate=-6.4,
+        temporal_date_from=datetime(1983, 4, 1, 12, 30),
+        temporal_date_to=date(2001, 12, 31),
+    )
+    root = build_metadata_tree(bundle).getroot()
+    assert root.find(f".//{GML_BEGIN_POSITION}").text == "1983-04-01"
+    assert root.find(f".//{GML_END_POSITION}").text == "2001-12-31"
+
+
+def test_build_metadata_tree_formats_citation_publication_datetime() -> None:
+    bundle = _bundle()
+    bundle["citation"] = {"citation_pubdate": datetime(2005, 6, 1, 0, 0)}
+    root = build_metadata_tree(bundle).getroot()
+    date_text = root.find(f".//{GMD_CI_DATE}/{GMD_DATE}/{GCO_CHARACTER_STRING}")
+    assert date_text.text == "2005-06-01"
+
+
+def test_build_metadata_tree_repeats_shared_source_citations() -> None:
+    bundle = _bundle()
+    bundle["sources"] = [
+        {"source_id": 1, "citation_id": 7},
+        {"source_id": 2, "citation_id": 7},
+    ]
+    bundle["citation_lookup"] = {7: {"citation_title": "Soil Survey Record"}}
+    root = build_metadata_tree(bundle).getroot()
+    citations = root.findall(f".//{GMD_SOURCE_CITATION}/{GMD_CI_CITATION}")
+    assert len(citations) == 2
+    assert citations[0] is not citations[1]
+    assert ET.tostring(citations[0]) == ET.tostring(citations[1])